@@ -1,5 +1,6 @@
 import os
 import re
+from pathlib import Path
 
 # ================= 配置区域 =================
 # 在这里修改你的输入文件路径
@@ -9,52 +10,58 @@ INPUT_SRT_PATH = r'/Users/gaohuyuchen/Downloads/AoKeLiDui_Sub.srt'
 OUTPUT_DIR = os.path.join(os.path.dirname(INPUT_SRT_PATH), "split_srt")
 # ===========================================
 
-def split_srt(input_path, output_folder):
-    if not os.path.exists(input_path):
-        print(f"错误：找不到文件 {input_path}")
-        return
-
-    if not os.path.exists(output_folder):
-        os.makedirs(output_folder)
-
-    with open(input_path, 'r', encoding='utf-8') as f:
-        content = f.read().strip()
+WRITE_BUFFER_SIZE = 1 << 20  # 输出文件写缓冲区大小(1 MB)
+BLOCK_SEPARATOR_RE = re.compile(rb'\n\s*\n')  # 字幕块之间的空行(可含空白字符)
 
-    # 使用两个换行符分割每一个字幕块
-    blocks = re.split(r'\n\s*\n', content)
-    
-    zh_blocks = []
-    en_blocks = []
+def iter_blocks(content):
+    """按空行逐个切出字幕块，不构造完整的块列表"""
+    start = 0
+    for match in BLOCK_SEPARATOR_RE.finditer(content):
+        yield content[start:match.start()]
+        start = match.end()
+    yield content[start:]
 
+def iter_cues(blocks):
+    """逐个解析字幕块(bytes)，生成 (序号, 时间轴, 中文, 英文) 的UTF-8字节"""
     for block in blocks:
-        lines = block.split('\n')
-        if len(lines) < 3:
+        try:
+            # 序号, 时间轴, 字幕文本内容
+            index, timestamp, text = block.split(b'\n', 2)
+        except ValueError:
             continue
-            
-        index = lines[0]        # 序号
-        timestamp = lines[1]    # 时间轴
-        text_lines = lines[2:]  # 字幕文本内容
 
         # 根据你的需求：第一行中文，第二行英文
         # 如果一个块内有多行，这里默认取第一行为中文，后续所有行为英文
-        zh_text = text_lines[0]
-        en_text = " ".join(text_lines[1:]) if len(text_lines) > 1 else ""
+        zh_text, _, en_text = text.partition(b'\n')
+        en_text = en_text.replace(b'\n', b' ')
+
+        yield index, timestamp, zh_text, en_text
+
+def split_srt(input_path, output_folder):
+    # 一次性读取整个文件(UTF-8字节原样保留，写出时无需重新编码)
+    try:
+        content = Path(input_path).read_bytes().replace(b'\r\n', b'\n').strip()
+    except FileNotFoundError:
+        print(f"错误：找不到文件 {input_path}")
+        return
 
-        # 构建新的字幕块
-        zh_blocks.append(f"{index}\n{timestamp}\n{zh_text}\n")
-        en_blocks.append(f"{index}\n{timestamp}\n{en_text}\n")
+    Path(output_folder).mkdir(parents=True, exist_ok=True)
 
     # 生成文件名
     base_name = os.path.splitext(os.path.basename(input_path))[0]
     zh_output = os.path.join(output_folder, f"{base_name}_ZH.srt")
     en_output = os.path.join(output_folder, f"{base_name}_EN.srt")
 
-    # 保存文件
-    with open(zh_output, 'w', encoding='utf-8') as f:
-        f.write("\n".join(zh_blocks))
-    
-    with open(en_output, 'w', encoding='utf-8') as f:
-        f.write("\n".join(en_blocks))
+    # 边解析边写入两个文件，不在内存中保留完整的输出
+    with open(zh_output, 'wb', buffering=WRITE_BUFFER_SIZE) as zh_f, \
+         open(en_output, 'wb', buffering=WRITE_BUFFER_SIZE) as en_f:
+        separator = b""
+        for index, timestamp, zh_text, en_text in iter_cues(iter_blocks(content)):
+            # 序号和时间轴部分两个文件共用，每个字幕块只拼接一次
+            head = b"".join((separator, index, b"\n", timestamp, b"\n"))
+            zh_f.write(b"".join((head, zh_text, b"\n")))
+            en_f.write(b"".join((head, en_text, b"\n")))
+            separator = b"\n"
 
     print(f"处理完成！")
     print(f"中文保存至: {zh_output}")
@@ -9,6 +9,7 @@ WAV文件时间码批量偏移脚本
 
 主要特性:
     - 批量处理整个文件夹的WAV文件
+    - 直接读写WAV文件bext块中的TimeReference，无需启动外部进程
     - 支持正向/负向帧数偏移
     - 自动读取WAV文件的采样率和当前时间码
     - 支持多种帧率(23.976, 24, 25, 29.97, 30, 50, 59.94, 60等)
@@ -16,7 +17,7 @@ WAV文件时间码批量偏移脚本
     - 处理结果统计和错误提示
 
 依赖工具:
-    - bwfmetaedit: 用于读写WAV文件的BWF元数据
+    - bwfmetaedit: 无法直接解析的文件(如RF64)回退使用，读写BWF元数据
       安装: macOS: brew install bwfmetaedit
            Linux: apt-get install bwfmetaedit
     - dftt-timecode: Python时间码处理库
@@ -34,11 +35,20 @@ WAV文件时间码批量偏移脚本
 """
 
 import os
+import mmap
+import shutil
+import struct
 import subprocess
+import sys
 import csv
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
+from fractions import Fraction
+from functools import lru_cache
 from pathlib import Path
-from dftt_timecode import DfttTimecode
+
+import numpy as np
 
 # ============ 配置区域 - 在这里修改参数 ============
 INPUT_FOLDER = "/Users/gaohuyuchen/Downloads/DAY004_Offset/"  # 输入文件夹路径
@@ -46,112 +56,289 @@ OFFSET_FRAMES = 146  # 偏移帧数（正数向后偏移，负数向前偏移）
 FRAME_RATE = 24  # 帧率 (23.976, 24, 25, 29.97, 30, 50, 59.94, 60 等)
 # =================================================
 
-def get_wav_timecode(wav_path):
-    """读取WAV文件的时间码"""
+BATCH_SIZE = 64  # 每次bwfmetaedit调用处理的文件数
+MAX_WORKERS = min(8, os.cpu_count() or 1)  # 并行的bwfmetaedit进程数
+NTSC_FRAME_RATES = {23.98, 29.97, 47.95, 59.94, 119.88}  # 按 N*1000/1001 计算的帧率
+BEXT_TIME_REFERENCE_OFFSET = 338  # bext块数据中TimeReferenceLow/High的偏移
+# Linux上不关闭继承的文件描述符；配合下方的绝对路径，subprocess才会走posix_spawn快速路径
+CLOSE_FDS = not sys.platform.startswith('linux')
+# 启动时解析一次bwfmetaedit的绝对路径(posix_spawn只接受带目录的可执行文件路径)；
+# 未安装时保留命令名，调用时照常抛出FileNotFoundError
+BWFMETAEDIT = shutil.which('bwfmetaedit') or 'bwfmetaedit'
+BWFMETAEDIT_MISSING = "错误: 未找到 bwfmetaedit 工具"  # 未安装时每个回退文件得到的错误信息
+
+# bwfmetaedit输出的表头在不同文件间相同，按表头字符串缓存列索引
+_CORE_COLUMNS_CACHE = {}
+
+def _core_columns(header):
+    """解析bwfmetaedit CSV表头，返回 (FileName, TimeReference, SampleRate) 列索引"""
+    columns = _CORE_COLUMNS_CACHE.get(header)
+    if columns is None:
+        names = next(csv.reader([header]))
+        columns = tuple(names.index(name) if name in names else None
+                        for name in ('FileName', 'TimeReference', 'SampleRate'))
+        _CORE_COLUMNS_CACHE[header] = columns
+    return columns
+
+def _field(fields, index):
+    """按列索引取值，列不存在时返回空字符串"""
+    if index is None or index >= len(fields):
+        return ''
+    return fields[index].strip()
+
+def _parse_core_row(fields, columns):
+    """从bwfmetaedit CSV行中解析(时间码样本数, 采样率)，失败返回错误信息"""
+    _, tr_idx, sr_idx = columns
+    if tr_idx is None:
+        return None, "错误: 未找到TimeReference列"
+
+    time_ref_value = _field(fields, tr_idx)
+    if not time_ref_value:
+        return None, "警告: TimeReference为空"
+
+    # 获取SampleRate值（与TimeReference在同一行）
+    sample_rate_value = _field(fields, sr_idx)
     try:
-        result = subprocess.run(
-            ['bwfmetaedit', '--out-core', wav_path],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        samples = int(time_ref_value)
+        sample_rate = int(sample_rate_value) if sample_rate_value else 48000  # 默认值
+    except ValueError:
+        return None, (f"错误: TimeReference/SampleRate值无法转换为整数: "
+                      f"{time_ref_value}, {sample_rate_value or 'N/A'}")
 
-        # 使用csv模块正确解析CSV输出（处理引号和换行符）
-        csv_reader = csv.DictReader(StringIO(result.stdout))
-
-        # 读取第一行数据
-        try:
-            row = next(csv_reader)
-
-            # 获取TimeReference值
-            if 'TimeReference' in row:
-                time_ref_value = row['TimeReference'].strip()
-                if time_ref_value:
-                    samples = int(time_ref_value)
-                    return samples
-                else:
-                    print(f"  警告: TimeReference为空")
-                    return None
-            else:
-                print(f"  错误: 未找到TimeReference列")
-                return None
+    return (samples, sample_rate), None
 
-        except StopIteration:
-            print(f"  错误: CSV无数据行")
-            return None
-        except ValueError as e:
-            print(f"  错误: TimeReference值无法转换为整数: {row.get('TimeReference', 'N/A')}")
-            return None
+def _split_core_rows(data, field_count):
+    """拆分bwfmetaedit CSV数据行
 
-    except subprocess.CalledProcessError as e:
-        print(f"  错误: 无法读取 {wav_path} 的时间码")
+    无引号时直接按逗号拆分；含引号或字段数与表头不符时回退到csv.reader
+    (处理字段内的逗号和换行符)
+    """
+    if '"' not in data:
+        rows = [line.rstrip('\r').split(',') for line in data.split('\n') if line]
+        if all(len(row) == field_count for row in rows):
+            return rows
+    return list(csv.reader(StringIO(data)))
+
+def _locate_bwf_fields(mm):
+    """遍历RIFF块，返回 (bext块数据偏移, 采样率)；不是带bext块的标准WAV时返回None"""
+    if len(mm) < 12 or mm[0:4] != b'RIFF' or mm[8:12] != b'WAVE':
         return None
-    except FileNotFoundError:
-        print("  错误: 未找到 bwfmetaedit 工具，请先安装")
-        print("  macOS: brew install bwfmetaedit")
-        print("  Linux: apt-get install bwfmetaedit 或从源码编译")
+
+    bext_offset = sample_rate = None
+    offset = 12
+    while offset + 8 <= len(mm) and (bext_offset is None or sample_rate is None):
+        chunk_id = mm[offset:offset + 4]
+        size, = struct.unpack_from('<I', mm, offset + 4)
+        data = offset + 8
+        if data + size > len(mm):
+            break
+        if chunk_id == b'fmt ' and size >= 8:
+            sample_rate, = struct.unpack_from('<I', mm, data + 4)
+        elif chunk_id == b'bext' and size >= BEXT_TIME_REFERENCE_OFFSET + 8:
+            bext_offset = data
+        offset = data + size + (size & 1)  # 块按偶数字节对齐
+
+    if bext_offset is None or sample_rate is None:
         return None
+    return bext_offset, sample_rate
 
-def get_sample_rate(wav_path):
-    """读取WAV文件的采样率"""
+def read_bwf_core(wav_path):
+    """直接解析WAV文件的bext块，返回 (时间码样本数, 采样率)，无法解析时返回None"""
+    try:
+        with open(wav_path, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            fields = _locate_bwf_fields(mm)
+            if fields is None:
+                return None
+            bext_offset, sample_rate = fields
+            low, high = struct.unpack_from('<II', mm, bext_offset + BEXT_TIME_REFERENCE_OFFSET)
+    except (OSError, ValueError):  # 空文件无法mmap时抛出ValueError
+        return None
+    return (high << 32) | low, sample_rate
+
+def write_bwf_time_reference(wav_path, samples):
+    """直接改写WAV文件bext块中的TimeReference，无法解析时返回False"""
+    try:
+        with open(wav_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+            fields = _locate_bwf_fields(mm)
+            if fields is None:
+                return False
+            struct.pack_into('<II', mm, fields[0] + BEXT_TIME_REFERENCE_OFFSET,
+                             samples & 0xFFFFFFFF, samples >> 32)
+    except (OSError, ValueError):
+        return False
+    return True
+
+def _chunks(items, size):
+    """按固定大小切分列表"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _run_batches(func, batches):
+    """在线程池中并行执行各批次的bwfmetaedit调用(等待子进程时会释放GIL)"""
+    if len(batches) <= 1:
+        return [func(batch) for batch in batches]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(batches))) as executor:
+        return list(executor.map(func, batches))
+
+def _read_core_batch(wav_paths):
+    """读取一批WAV文件的时间码和采样率(一次bwfmetaedit调用)
+
+    整批失败时逐个文件重试，只有出错的文件得到错误信息；
+    未安装bwfmetaedit时每个文件都得到 BWFMETAEDIT_MISSING
+    """
     try:
         result = subprocess.run(
-            ['bwfmetaedit', '--out-core', wav_path],
+            [BWFMETAEDIT, '--out-core', *wav_paths],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            close_fds=CLOSE_FDS
         )
-        
-        for line in result.stdout.split('\n'):
-            if 'SampleRate' in line:
-                sample_rate = int(line.split(':')[-1].strip())
-                return sample_rate
-        return 48000  # 默认值
-    except:
-        return 48000
-
-def set_wav_timecode(wav_path, samples):
-    """设置WAV文件的时间码"""
+    except subprocess.CalledProcessError as e:
+        if len(wav_paths) > 1:
+            # 一个损坏或被占用的文件会让整批失败，逐个重试找出它
+            cores = {}
+            for wav_path in wav_paths:
+                cores.update(_read_core_batch([wav_path]))
+            return cores
+        error = "错误: bwfmetaedit读取失败"
+        if e.stderr:
+            error += f" ({e.stderr.strip()})"
+        return {wav_paths[0]: (None, error)}
+    except FileNotFoundError:
+        return {wav_path: (None, BWFMETAEDIT_MISSING) for wav_path in wav_paths}
+
+    # 表头只解析一次；每个文件一行数据
+    header, _, data = result.stdout.partition('\n')
+    header = header.rstrip('\r')
+    columns = _core_columns(header)
+    rows = _split_core_rows(data, header.count(',') + 1)
+    by_name = {_field(row, columns[0]): row for row in rows}
+
+    cores = {}
+    for index, wav_path in enumerate(wav_paths):
+        row = by_name.get(wav_path)
+        if row is None and len(rows) == len(wav_paths):
+            # FileName列缺失或路径格式不同时按输出顺序匹配
+            row = rows[index]
+        if row is None:
+            cores[wav_path] = (None, "错误: CSV无数据行")
+        else:
+            cores[wav_path] = _parse_core_row(row, columns)
+    return cores
+
+def get_wav_cores(wav_paths):
+    """批量读取WAV文件的时间码和采样率
+
+    优先直接解析bext块；无法解析的文件每批一次bwfmetaedit调用，批次间并行。
+    返回 {路径: ((samples, sample_rate) 或 None, 错误信息)}；
+    未安装bwfmetaedit时只有需要回退的文件失败，安装提示只打印一次；
+    所有文件都需要回退时没有可处理的文件，返回None
+    """
+    cores = {}
+    fallback_paths = []
+    for wav_path in wav_paths:
+        core = read_bwf_core(wav_path)
+        if core is None:
+            fallback_paths.append(wav_path)
+        else:
+            cores[wav_path] = (core, None)
+
+    for batch_cores in _run_batches(_read_core_batch, _chunks(fallback_paths, BATCH_SIZE)):
+        cores.update(batch_cores)
+
+    if fallback_paths and cores[fallback_paths[0]][1] == BWFMETAEDIT_MISSING:
+        print("错误: 未找到 bwfmetaedit 工具，请先安装")
+        print("macOS: brew install bwfmetaedit")
+        print("Linux: apt-get install bwfmetaedit 或从源码编译")
+        if len(fallback_paths) == len(wav_paths):
+            return None
+    return cores
+
+def _write_core_batch(items):
+    """通过CSV清单一次bwfmetaedit调用写入一批文件的时间码，返回写入成功的路径集合
+
+    整批失败时逐个文件重试，只有出错的文件不计入成功
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', newline='',
+                                     encoding='utf-8', delete=False) as f:
+        writer = csv.writer(f)
+        writer.writerow(['FileName', 'TimeReference'])
+        writer.writerows(items)
+        manifest_path = f.name
+
     try:
         subprocess.run(
-            ['bwfmetaedit', f'--Timereference={samples}', wav_path],
+            [BWFMETAEDIT, f'--in-core={manifest_path}'],
             check=True,
-            capture_output=True
+            capture_output=True,
+            close_fds=CLOSE_FDS
         )
-        return True
     except subprocess.CalledProcessError as e:
-        print(f"  错误: 无法写入 {wav_path} 的时间码")
-        if e.stderr:
-            print(f"  详情: {e.stderr.decode() if isinstance(e.stderr, bytes) else e.stderr}")
-        return False
+        error = e
+    except FileNotFoundError:
+        for wav_path, _ in items:
+            print(f"错误: 无法写入 {wav_path} 的时间码 (未找到 bwfmetaedit 工具)")
+        return set()
+    else:
+        return {wav_path for wav_path, _ in items}
+    finally:
+        os.remove(manifest_path)
 
-def samples_to_timecode(samples, sample_rate, frame_rate):
-    """将样本数转换为时间码"""
-    seconds = samples / sample_rate
-    # 使用float类型创建时间码，timecode_type='time'表示输入是秒数
-    return DfttTimecode(seconds, timecode_type='time', fps=frame_rate)
+    if len(items) > 1:
+        # 一个文件出错会让整批失败，逐个重试以保留其余文件的写入
+        return set().union(*(_write_core_batch([item]) for item in items))
 
-def timecode_to_samples(timecode, sample_rate):
-    """将时间码转换为样本数"""
-    # 使用timestamp属性获取秒数
-    seconds = timecode.timestamp
-    return int(seconds * sample_rate)
+    print(f"错误: 无法写入 {items[0][0]} 的时间码")
+    if error.stderr:
+        print(f"详情: {error.stderr.decode() if isinstance(error.stderr, bytes) else error.stderr}")
+    return set()
 
-def offset_timecode(timecode, offset_frames, frame_rate):
-    """偏移时间码指定帧数"""
-    # 使用framecount属性获取总帧数
-    total_frames = timecode.framecount
+def set_wav_timecodes(new_samples_by_path):
+    """批量设置WAV文件的时间码，返回写入成功的路径集合
 
-    # 应用偏移
-    new_frames = total_frames + offset_frames
+    优先直接改写bext块；无法改写的文件每批一次bwfmetaedit调用，批次间并行
+    """
+    written = set()
+    fallback_items = []
+    for wav_path, new_samples in new_samples_by_path.items():
+        if write_bwf_time_reference(wav_path, new_samples):
+            written.add(wav_path)  # 直接改写成功，不受bwfmetaedit批次结果影响
+        else:
+            fallback_items.append((wav_path, new_samples))
 
-    # 确保不为负数
-    if new_frames < 0:
-        print(f"警告: 偏移后时间码为负数，将设置为 00:00:00:00")
-        new_frames = 0
+    for batch_written in _run_batches(_write_core_batch, _chunks(fallback_items, BATCH_SIZE)):
+        written |= batch_written
+    return written
 
-    # 使用int类型创建时间码，timecode_type='frame'表示输入是帧数
-    return DfttTimecode(new_frames, timecode_type='frame', fps=frame_rate)
+def frame_rate_fraction(frame_rate):
+    """将帧率转换为精确分数(NTSC帧率如23.976/29.97按 N*1000/1001 处理)"""
+    if round(frame_rate, 2) in NTSC_FRAME_RATES:
+        return Fraction(round(frame_rate) * 1000, 1001)
+    return Fraction(str(frame_rate))
+
+@lru_cache(maxsize=512)
+def samples_to_smpte(samples, sample_rate, frame_rate):
+    """将样本数转换为SMPTE时间码字符串(仅用于显示，相同起始时间码的文件共享结果)"""
+    # 延迟导入：只有显示需要时间码库，偏移计算路径不依赖它
+    from dftt_timecode import DfttTimecode
+
+    seconds = samples / sample_rate
+    # 使用float类型创建时间码，timecode_type='time'表示输入是秒数
+    return DfttTimecode(seconds, timecode_type='time', fps=frame_rate).timecode_output('smpte')
+
+def offset_samples(samples, sample_rates, offset_frames, fps_fraction):
+    """批量将样本数偏移指定帧数(NumPy int64整数运算，不经过时间码对象)
+
+    偏移量 = offset_frames * sample_rate / fps，按四舍六入五成双取整，
+    与 round(Fraction) 的结果一致；结果可能为负数，由调用方处理
+    """
+    dividend = offset_frames * fps_fraction.denominator * sample_rates
+    quotient, remainder = np.divmod(dividend, fps_fraction.numerator)
+    twice_remainder = 2 * remainder
+    round_up = ((twice_remainder > fps_fraction.numerator)
+                | ((twice_remainder == fps_fraction.numerator) & (quotient % 2 == 1)))
+    return samples + quotient + round_up
 
 def process_wav_files(folder_path, offset_frames, frame_rate):
     """批量处理文件夹中的所有WAV文件"""
@@ -161,8 +348,14 @@ def process_wav_files(folder_path, offset_frames, frame_rate):
         print(f"错误: 文件夹不存在: {folder_path}")
         return
     
-    # 获取所有WAV文件
-    wav_files = list(folder.glob("*.wav")) + list(folder.glob("*.WAV"))
+    # 获取所有WAV文件(单次读取目录，扩展名不区分大小写)
+    # 按真实路径去重，避免符号链接等指向同一文件的条目被重复偏移
+    unique_files = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith('.wav'):
+                unique_files.setdefault(os.path.realpath(entry.path), Path(entry.path))
+    wav_files = list(unique_files.values())
     
     if not wav_files:
         print(f"未在 {folder_path} 中找到WAV文件")
@@ -172,36 +365,60 @@ def process_wav_files(folder_path, offset_frames, frame_rate):
     print(f"偏移参数: {offset_frames} 帧 @ {frame_rate} fps")
     print("-" * 60)
     
-    success_count = 0
-    
-    for wav_file in wav_files:
+    # 一次性读取所有文件的时间码和采样率
+    wav_paths = [str(wav_file) for wav_file in wav_files]
+    cores = get_wav_cores(wav_paths)
+    if cores is None:
+        return
+
+    # 用NumPy一次计算所有可读取文件的新时间码
+    fps_fraction = frame_rate_fraction(frame_rate)
+    valid_cores = {wav_path: core for wav_path, (core, _) in cores.items() if core is not None}
+    samples = np.fromiter((core[0] for core in valid_cores.values()), dtype=np.int64,
+                          count=len(valid_cores))
+    sample_rates = np.fromiter((core[1] for core in valid_cores.values()), dtype=np.int64,
+                               count=len(valid_cores))
+    offset_results = dict(zip(
+        valid_cores, offset_samples(samples, sample_rates, offset_frames, fps_fraction).tolist()))
+
+    new_samples_by_path = {}
+    unchanged_count = 0
+
+    for wav_file, wav_path in zip(wav_files, wav_paths):
         print(f"\n处理: {wav_file.name}")
-        
-        # 读取当前时间码
-        current_samples = get_wav_timecode(str(wav_file))
-        if current_samples is None:
+
+        core, error = cores[wav_path]
+        if core is None:
+            print(f"  {error}")
             continue
+        current_samples, sample_rate = core
         
-        # 读取采样率
-        sample_rate = get_sample_rate(str(wav_file))
-        
-        # 转换为时间码
-        current_tc = samples_to_timecode(current_samples, sample_rate, frame_rate)
-        print(f"  当前时间码: {current_tc.timecode_output('smpte')}")
+        print(f"  当前时间码: {samples_to_smpte(current_samples, sample_rate, frame_rate)}")
 
-        # 应用偏移
-        new_tc = offset_timecode(current_tc, offset_frames, frame_rate)
-        print(f"  新时间码:   {new_tc.timecode_output('smpte')}")
-        
-        # 转换回样本数
-        new_samples = timecode_to_samples(new_tc, sample_rate)
-        
-        # 写入新时间码
-        if set_wav_timecode(str(wav_file), new_samples):
-            print(f"  ✓ 成功")
-            success_count += 1
-        else:
-            print(f"  ✗ 失败")
+        # 确保不为负数
+        new_samples = offset_results[wav_path]
+        if new_samples < 0:
+            print(f"  警告: 偏移后时间码为负数，将设置为 00:00:00:00")
+            new_samples = 0
+
+        print(f"  新时间码:   {samples_to_smpte(new_samples, sample_rate, frame_rate)}")
+
+        # 时间码未变化时不写入文件
+        if new_samples == current_samples:
+            print("  = 无变化，跳过")
+            unchanged_count += 1
+            continue
+
+        new_samples_by_path[wav_path] = new_samples
+
+    # 一次性写入所有新时间码，按文件统计结果
+    print("\n" + "-" * 60)
+    written = set_wav_timecodes(new_samples_by_path)
+    print(f"✓ 成功写入 {len(written)} 个文件")
+    for wav_path in new_samples_by_path:
+        if wav_path not in written:
+            print(f"✗ 写入失败: {Path(wav_path).name}")
+    success_count = unchanged_count + len(written)
     
     print("\n" + "=" * 60)
     print(f"完成! 成功处理 {success_count}/{len(wav_files)} 个文件")
@@ -5,20 +5,316 @@ Dark UI Template - Reusable PyQt5 Dark Theme Interface Template
 A professional dark-themed UI template for rapid application development
 """
 
+import os
 import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
     QWidget, QLabel, QPushButton, QTextEdit, QFrame,
-    QComboBox, QTableWidget, QTableWidgetItem, QHeaderView
+    QComboBox, QTableView, QHeaderView, QSizePolicy, QButtonGroup
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QEvent, QAbstractTableModel, QModelIndex, pyqtSlot
 from PyQt5.QtGui import QPalette, QColor
-import PyQt5.QtCore as QtCore
+
+
+# Qt enum values used on hot paths (key events, model data), looked up once
+_KEY_PRESS = QEvent.KeyPress
+_KEY_RETURN = Qt.Key_Return
+_KEY_ENTER = Qt.Key_Enter
+_NEWLINE_MODIFIERS = Qt.ControlModifier | Qt.MetaModifier
+_DISPLAY_ROLE = Qt.DisplayRole
+_HORIZONTAL = Qt.Horizontal
+_ALIGN_LEFT_VCENTER = Qt.AlignLeft | Qt.AlignVCenter
+
+# Minimum rows the data table reports, so the striped background fills the view
+TABLE_MIN_ROWS = 12
+
+# Data table storage: one record per row, the version field drives the table filter
+TABLE_DTYPE = np.dtype([
+    ('id', 'U8'), ('name', 'U32'), ('status', 'U8'), ('note', 'U64'), ('version', 'U4')
+])
+
+
+def _version_mask_numpy(version_codes, target_code):
+    """Boolean mask of rows whose version code equals target_code"""
+    return version_codes == target_code
+
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy's vectorized comparison
+    version_mask = _version_mask_numpy
+else:
+    @njit(cache=True)
+    def version_mask(version_codes, target_code):
+        """Boolean mask of rows whose version code equals target_code (compiled)"""
+        out = np.empty(version_codes.shape[0], np.bool_)
+        for i in range(version_codes.shape[0]):
+            out[i] = version_codes[i] == target_code
+        return out
+
+
+def warm_up_version_mask():
+    """Compile (or load from cache) the filter kernel before the first real call"""
+    version_mask(np.zeros(1, dtype=np.intp), 0)
+
+
+# Image assets referenced from APP_QSS
+_ASSETS_DIR = Path(__file__).resolve().parent / "dark_ui_assets"
+
+# Shared size policies (QSizePolicy is a value type, setSizePolicy copies it)
+_EXPAND_FIXED = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+_EXPAND_EXPAND = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+# Action button colors (kind, RGB)
+BUTTON_COLORS = (
+    ('Primary', (100, 150, 200)),       # Blue
+    ('Secondary', (180, 118, 0)),       # Orange
+    ('Success', (0, 130, 0)),           # Green
+    ('Warning', (135, 135, 45)),        # Yellow
+    ('Danger', (150, 50, 50)),          # Red
+)
+
+
+def _build_action_button_qss(button_colors):
+    """Build the normal/hover/pressed rules for every action button kind"""
+    rules = []
+    for kind, color in button_colors:
+        normal = "rgb({}, {}, {})".format(*color)
+        hover = "rgb({}, {}, {})".format(*(min(255, c + 30) for c in color))
+        rules.append(f"""
+QPushButton[btnKind="{kind}"] {{
+    background-color: {normal};
+}}
+QPushButton[btnKind="{kind}"]:hover {{
+    background-color: {hover};
+}}
+QPushButton[btnKind="{kind}"]:pressed {{
+    background-color: {normal};
+}}""")
+    return "".join(rules)
+
+
+# Per-kind action button colors, selected by the btnKind dynamic property
+_ACTION_BUTTON_QSS = _build_action_button_qss(BUTTON_COLORS)
+
+# Combobox arrow drawn from an image instead of an overlay label
+_COMBO_ARROW_QSS = f"""
+QComboBox::down-arrow {{
+    image: url("{(_ASSETS_DIR / 'down_arrow.svg').as_posix()}");
+    width: 8px;
+    height: 5px;
+    right: 8px;
+}}"""
+
+# Application-wide stylesheet, parsed once when applied to QApplication
+APP_QSS = """
+QWidget {
+    background-color: rgb(40, 40, 46);
+}
+QLabel#TitleLabel {
+    color: rgb(255, 255, 255);
+    font-size: 16px;
+    font-weight: regular;
+    font-family: 'Open Sans', sans-serif;
+}
+QLabel#SectionLabel {
+    color: rgb(145, 145, 145);
+    font-size: 14px;
+    font-weight: semibold;
+    font-family: 'Open Sans', sans-serif;
+}
+QLabel#StatusLabel {
+    font-size: 11px;
+    font-style: italic;
+}
+QFrame#Separator {
+    background-color: rgb(9, 9, 9);
+    border: none;
+}
+QPushButton {
+    background-color: rgb(40, 40, 46);
+    color: rgb(145, 145, 145);
+    border: 1px solid rgb(100, 100, 100);
+    border-radius: 12px;
+    font-size: 11px;
+    font-weight: semibold;
+    font-family: 'Open Sans', sans-serif;
+}
+QPushButton:hover {
+    background-color: rgb(53, 53, 58);
+}
+QPushButton:pressed {
+    background-color: rgb(23, 23, 28);
+}
+QPushButton[btnKind] {
+    color: rgb(255, 255, 255);
+    border: 1px solid rgb(100, 100, 100);
+    border-radius: 15px;
+}""" + _ACTION_BUTTON_QSS + """
+QPushButton[btnKind]:checked {
+    border: 2px solid rgb(255, 255, 255);
+}
+QComboBox {
+    background-color: rgb(31, 31, 31);
+    color: rgb(145, 145, 145);
+    border: 1px solid rgb(7, 7, 7);
+    border-radius: 3px;
+    padding: 3px 8px;
+    font-size: 12px;
+    font-family: 'Open Sans', sans-serif;
+}
+QComboBox::drop-down {
+    border: none;
+    background: transparent;
+}
+QComboBox QAbstractItemView {
+    background-color: rgb(31, 31, 31);
+    color: rgb(145, 145, 145);
+    border: 1px solid rgb(7, 7, 7);
+    selection-background-color: rgb(100, 200, 255);
+}
+QTextEdit {
+    background-color: rgb(31, 31, 31);
+    color: rgb(145, 145, 145);
+    border: 1px solid rgb(7, 7, 7);
+    border-radius: 3px;
+    padding: 5px;
+    font-size: 12px;
+    font-family: 'Open Sans', sans-serif;
+}
+QTableView#DataTable {
+    background-color: rgb(40, 40, 46);
+    color: rgb(145, 145, 145);
+    border: 1px solid rgb(7, 7, 7);
+    border-radius: 3px;
+    gridline-color: transparent;
+    font-size: 11px;
+    font-family: 'Helvetica', 'Arial', sans-serif;
+    alternate-background-color: rgb(36, 36, 42);
+}
+QTableView#DataTable::item {
+    padding: 2px;
+    border: none;
+}
+QTableView#DataTable::item:selected {
+    background-color: rgb(40, 40, 46);
+    color: rgb(255, 255, 255);
+    border: none;
+    outline: none;
+}
+QTableView#DataTable::item:focus {
+    background-color: rgb(40, 40, 46);
+    color: rgb(255, 255, 255);
+    border: none;
+    outline: none;
+}
+#DataTable QHeaderView::section {
+    background-color: rgb(33, 33, 38);
+    color: rgb(145, 145, 145);
+    border-left: 1px solid rgb(67, 71, 77);
+    border-right: none;
+    border-top: none;
+    border-bottom: 1px solid rgb(9, 9, 9);
+    padding: 2px;
+    font-size: 11px;
+    font-weight: normal;
+    font-family: 'Helvetica', 'Arial', sans-serif;
+}
+#DataTable QHeaderView::section:hover {
+    background-color: rgb(33, 33, 38);
+    color: rgb(145, 145, 145);
+    font-weight: normal;
+}
+#DataTable QHeaderView::section:pressed {
+    background-color: rgb(33, 33, 38);
+    color: rgb(145, 145, 145);
+    font-weight: normal;
+}
+#DataTable QHeaderView::section:first {
+    border-left: none;
+}
+#DataTable QScrollBar:vertical {
+    background: transparent;
+    width: 8px;
+    border: none;
+}
+#DataTable QScrollBar::handle:vertical {
+    background: rgb(90, 95, 102);
+    min-height: 20px;
+    border-radius: 4px;
+    margin: 0px;
+}
+#DataTable QScrollBar::handle:vertical:hover {
+    background: rgb(110, 115, 122);
+}
+#DataTable QScrollBar::add-line:vertical, #DataTable QScrollBar::sub-line:vertical {
+    border: none;
+    background: none;
+    height: 0px;
+}
+#DataTable QScrollBar::up-arrow:vertical, #DataTable QScrollBar::down-arrow:vertical {
+    border: none;
+    width: 0px;
+    height: 0px;
+    background: none;
+}
+#DataTable QScrollBar::add-page:vertical, #DataTable QScrollBar::sub-page:vertical {
+    background: none;
+}""" + _COMBO_ARROW_QSS + "\n"
+
+
+class DataTableModel(QAbstractTableModel):
+    """Read-only table model backed by a list of row tuples"""
+
+    def __init__(self, headers, min_rows=0, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._min_rows = min_rows
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        # Keep at least min_rows rows so the striped background fills the view
+        return max(self._min_rows, len(self._rows))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        # Rows past the data are empty padding
+        if role == _DISPLAY_ROLE and index.row() < len(self._rows):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == _HORIZONTAL:
+            return self._headers[section]
+        return None
 
 
 class DarkUITemplate(QMainWindow):
     """Reusable Dark UI Template Class"""
 
+    # Action button data (text, type), shared by all instances
+    ACTION_BUTTONS_DATA = (
+        ("按钮1", "Primary"),
+        ("按钮2", "Secondary"),
+        ("按钮3", "Success"),
+        ("按钮4", "Warning"),
+        ("按钮5", "Danger"),
+    )
+
     def __init__(self):
         super().__init__()
         # Initialize state variables
@@ -27,88 +323,15 @@ class DarkUITemplate(QMainWindow):
         self.selected_version = "v1"
         self.selected_table_version = "all"
 
-        # Define color schemes for buttons
-        self.button_colors = {
-            'Primary': (100, 150, 200),       # Blue
-            'Secondary': (180, 118, 0),       # Orange
-            'Success': (0, 130, 0),           # Green
-            'Warning': (135, 135, 45),        # Yellow
-            'Danger': (150, 50, 50)           # Red
-        }
-
-        # Define button data (text, type)
-        self.action_buttons_data = [
-            ("按钮1", "Primary"),
-            ("按钮2", "Secondary"),
-            ("按钮3", "Success"),
-            ("按钮4", "Warning"),
-            ("按钮5", "Danger")
-        ]
-
-        # Initialize UI styles and setup
-        self._init_styles()
+        # Sample table data (structured array so filtering by version is vectorized)
+        self.set_table_rows(np.array([
+            ("1", "项目A", "完成", "备注1", "v1"),
+            ("2", "项目B", "进行中", "备注2", "v2"),
+            ("3", "项目C", "待开始", "备注3", "v1"),
+        ], dtype=TABLE_DTYPE))
+
+        # Setup UI (styling comes from APP_QSS applied to the application)
         self.setup_ui()
-        self.setup_styles()
-
-    def _init_styles(self):
-        """Initialize common UI styles"""
-        self.common_styles = {
-            'font_family': "'Open Sans', sans-serif",
-            'label_style': "color: rgb(145, 145, 145); font-size: 14px; font-weight: semibold; font-family: 'Open Sans', sans-serif;",
-            'button_style': """
-                QPushButton {
-                    background-color: rgb(40, 40, 46);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 12px;
-                    font-size: 11px;
-                    font-weight: semibold;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QPushButton:hover {
-                    background-color: rgb(53, 53, 58);
-                }
-                QPushButton:pressed {
-                    background-color: rgb(23, 23, 28);
-                }
-            """,
-            'combobox_style': """
-                QComboBox {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 3px 8px;
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    background: transparent;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border: none;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    selection-background-color: rgb(100, 200, 255);
-                }
-            """,
-            'textedit_style': """
-                QTextEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 5px;
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                }
-            """
-        }
 
     def setup_ui(self):
         """Setup UI interface"""
@@ -116,7 +339,6 @@ class DarkUITemplate(QMainWindow):
         self.setWindowTitle("🔧 Dark UI Template")
         self.setMinimumSize(350, 700)
         self.resize(350, 700)
-        self.setStyleSheet("background-color: rgb(40, 40, 46);")
 
         # Central widget
         central_widget = QWidget()
@@ -153,14 +375,14 @@ class DarkUITemplate(QMainWindow):
     def setup_header(self, layout):
         """Setup header section"""
         title_label = QLabel("Dark UI Template - 深色主题模板")
-        title_label.setStyleSheet("color: rgb(255, 255, 255); font-size: 16px; font-weight: regular; font-family: 'Open Sans', sans-serif;")
+        title_label.setObjectName("TitleLabel")
         title_label.setAlignment(Qt.AlignLeft)
         layout.addWidget(title_label)
 
     def setup_version_selection(self, layout):
         """Setup version selection"""
         version_label = QLabel("版本选择")
-        version_label.setStyleSheet(self.common_styles['label_style'])
+        version_label.setObjectName("SectionLabel")
         version_label.setFixedHeight(15)
         layout.addWidget(version_label)
 
@@ -168,17 +390,14 @@ class DarkUITemplate(QMainWindow):
         self.version_combo.setFixedSize(80, 25)
         self.version_combo.addItems(["v1", "v2", "v3", "v4", "v5"])
         self.version_combo.setCurrentText(self.selected_version)
-        self.version_combo.setStyleSheet(self.common_styles['combobox_style'])
         self.version_combo.currentTextChanged.connect(self.on_version_changed)
 
-        # Add custom arrow
-        self._add_combobox_arrow(self.version_combo)
         layout.addWidget(self.version_combo)
 
     def setup_action_buttons(self, layout):
         """Setup action buttons section"""
         section_label = QLabel("操作按钮")
-        section_label.setStyleSheet(self.common_styles['label_style'])
+        section_label.setObjectName("SectionLabel")
         section_label.setFixedHeight(15)
         layout.addWidget(section_label)
 
@@ -187,17 +406,24 @@ class DarkUITemplate(QMainWindow):
         button_layout.setContentsMargins(0, 0, 0, 0)
         button_layout.setSpacing(5)
 
-        # Store button references
+        # Checkable buttons in an exclusive group; the checked state drives the
+        # selected style, and the group id indexes ACTION_BUTTONS_DATA
         self.action_buttons = {}
+        self.action_group = QButtonGroup(self)
+        self.action_group.setExclusive(True)
 
-        for label, button_type in self.action_buttons_data:
+        for button_id, (label, button_type) in enumerate(self.ACTION_BUTTONS_DATA):
             btn = QPushButton(label)
-            btn.setSizePolicy(btn.sizePolicy().Expanding, btn.sizePolicy().Fixed)
+            btn.setSizePolicy(_EXPAND_FIXED)
             btn.setFixedHeight(30)
-            btn.clicked.connect(lambda _, bt=button_type: self.handle_action(bt))
+            btn.setCheckable(True)
+            btn.setProperty("btnKind", button_type)
+            self.action_group.addButton(btn, button_id)
             button_layout.addWidget(btn)
             self.action_buttons[button_type] = btn
 
+        self.action_group.idClicked.connect(self.on_action_clicked)
+
         # Create container widget for buttons
         button_widget = QWidget()
         button_widget.setLayout(button_layout)
@@ -207,16 +433,15 @@ class DarkUITemplate(QMainWindow):
     def setup_text_input(self, layout):
         """Setup text input section"""
         notes_label = QLabel("文本输入")
-        notes_label.setStyleSheet(self.common_styles['label_style'])
+        notes_label.setObjectName("SectionLabel")
         notes_label.setFixedHeight(15)
         layout.addWidget(notes_label)
 
         self.text_input = QTextEdit()
         self.text_input.setFixedHeight(80)
-        self.text_input.setSizePolicy(self.text_input.sizePolicy().Expanding, self.text_input.sizePolicy().Fixed)
+        self.text_input.setSizePolicy(_EXPAND_FIXED)
         self.text_input.setPlaceholderText("请输入内容...")
-        self.text_input.setStyleSheet(self.common_styles['textedit_style'])
-        self.text_input.keyPressEvent = self.text_input_key_press_event
+        self.text_input.installEventFilter(self)
         layout.addWidget(self.text_input)
 
     def setup_control_buttons(self, layout):
@@ -229,13 +454,19 @@ class DarkUITemplate(QMainWindow):
         self.status_label = QLabel("")
         self.status_label.setFixedHeight(25)
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: rgb(145, 145, 145);
-                font-size: 11px;
-                font-style: italic;
-            }
-        """)
+        self.status_label.setObjectName("StatusLabel")
+
+        # Status colors are swapped via prebuilt palettes (no color rule in APP_QSS)
+        self._status_palettes = {}
+        for is_success, color in ((True, QColor(100, 200, 100)), (False, QColor(200, 100, 100))):
+            palette = QPalette(self.status_label.palette())
+            palette.setColor(QPalette.WindowText, color)
+            self._status_palettes[is_success] = palette
+
+        # One timer clears the status; restarting it keeps the latest message for 3 seconds
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self.status_label.clear)
         button_layout.addWidget(self.status_label)
 
         # Add stretch
@@ -244,14 +475,12 @@ class DarkUITemplate(QMainWindow):
         # Cancel button
         self.cancel_btn = QPushButton("取消")
         self.cancel_btn.setFixedSize(70, 25)
-        self.cancel_btn.setStyleSheet(self.common_styles['button_style'])
         self.cancel_btn.clicked.connect(self.cancel_action)
         button_layout.addWidget(self.cancel_btn)
 
         # Confirm button
         self.confirm_btn = QPushButton("确认")
         self.confirm_btn.setFixedSize(70, 25)
-        self.confirm_btn.setStyleSheet(self.common_styles['button_style'])
         self.confirm_btn.clicked.connect(self.confirm_action)
         button_layout.addWidget(self.confirm_btn)
 
@@ -264,7 +493,7 @@ class DarkUITemplate(QMainWindow):
     def setup_data_table(self, layout):
         """Setup data table"""
         table_label = QLabel("数据表格")
-        table_label.setStyleSheet(self.common_styles['label_style'])
+        table_label.setObjectName("SectionLabel")
         table_label.setFixedHeight(15)
         layout.addWidget(table_label)
 
@@ -278,16 +507,13 @@ class DarkUITemplate(QMainWindow):
         self.table_combo.setFixedSize(80, 25)
         self.table_combo.addItems(["all", "v1", "v2", "v3", "v4", "v5"])
         self.table_combo.setCurrentText(self.selected_table_version)
-        self.table_combo.setStyleSheet(self.common_styles['combobox_style'])
         self.table_combo.currentTextChanged.connect(self.on_table_version_changed)
 
-        self._add_combobox_arrow(self.table_combo)
         table_controls_layout.addWidget(self.table_combo)
 
         # Refresh button
         self.refresh_btn = QPushButton("刷新")
         self.refresh_btn.setFixedSize(60, 25)
-        self.refresh_btn.setStyleSheet(self.common_styles['button_style'])
         self.refresh_btn.clicked.connect(self.refresh_table)
         table_controls_layout.addWidget(self.refresh_btn)
 
@@ -297,7 +523,6 @@ class DarkUITemplate(QMainWindow):
         # Export button
         self.export_btn = QPushButton("导出")
         self.export_btn.setFixedSize(60, 25)
-        self.export_btn.setStyleSheet(self.common_styles['button_style'])
         self.export_btn.clicked.connect(self.export_data)
         table_controls_layout.addWidget(self.export_btn)
 
@@ -308,12 +533,13 @@ class DarkUITemplate(QMainWindow):
         layout.addWidget(table_controls_widget)
 
         # Create table
-        self.data_table = QTableWidget()
+        self.table_model = DataTableModel(["ID", "名称", "状态", "备注"], min_rows=TABLE_MIN_ROWS, parent=self)
+        self.data_table = QTableView()
+        self.data_table.setObjectName("DataTable")
+        self.data_table.setModel(self.table_model)
         self.data_table.setMinimumSize(330, 200)
-        self.data_table.setSizePolicy(self.data_table.sizePolicy().Expanding, self.data_table.sizePolicy().Expanding)
-        self.data_table.setColumnCount(4)
-        self.data_table.setHorizontalHeaderLabels(["ID", "名称", "状态", "备注"])
-        self.data_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.data_table.setSizePolicy(_EXPAND_EXPAND)
+        self.data_table.setEditTriggers(QTableView.NoEditTriggers)
 
         # Set column properties
         header = self.data_table.horizontalHeader()
@@ -321,318 +547,192 @@ class DarkUITemplate(QMainWindow):
         header.setSectionResizeMode(1, QHeaderView.Interactive)
         header.setSectionResizeMode(2, QHeaderView.Fixed)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
-        header.setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        header.setDefaultAlignment(_ALIGN_LEFT_VCENTER)
 
         self.data_table.setColumnWidth(0, 35)
         self.data_table.setColumnWidth(1, 120)
         self.data_table.setColumnWidth(2, 60)
 
-        # Apply dark table styling
-        self.data_table.setStyleSheet("""
-            QTableWidget {
-                background-color: rgb(40, 40, 46);
-                color: rgb(145, 145, 145);
-                border: 1px solid rgb(7, 7, 7);
-                border-radius: 3px;
-                gridline-color: transparent;
-                font-size: 11px;
-                font-family: 'Helvetica', 'Arial', sans-serif;
-                alternate-background-color: rgb(36, 36, 42);
-            }
-            QTableWidget::item {
-                padding: 2px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background-color: rgb(40, 40, 46);
-                color: rgb(255, 255, 255);
-                border: none;
-                outline: none;
-            }
-            QTableWidget::item:focus {
-                background-color: rgb(40, 40, 46);
-                color: rgb(255, 255, 255);
-                border: none;
-                outline: none;
-            }
-            QHeaderView::section {
-                background-color: rgb(33, 33, 38);
-                color: rgb(145, 145, 145);
-                border-left: 1px solid rgb(67, 71, 77);
-                border-right: none;
-                border-top: none;
-                border-bottom: 1px solid rgb(9, 9, 9);
-                padding: 2px;
-                font-size: 11px;
-                font-weight: normal;
-                font-family: 'Helvetica', 'Arial', sans-serif;
-            }
-            QHeaderView::section:hover {
-                background-color: rgb(33, 33, 38);
-                color: rgb(145, 145, 145);
-                font-weight: normal;
-            }
-            QHeaderView::section:pressed {
-                background-color: rgb(33, 33, 38);
-                color: rgb(145, 145, 145);
-                font-weight: normal;
-            }
-            QHeaderView::section:first {
-                border-left: none;
-            }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 8px;
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                background: rgb(90, 95, 102);
-                min-height: 20px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgb(110, 115, 122);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {
-                border: none;
-                width: 0px;
-                height: 0px;
-                background: none;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
-
         # Set table properties
         self.data_table.setAlternatingRowColors(True)
         self.data_table.verticalHeader().setVisible(False)
         self.data_table.setShowGrid(False)
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.data_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.data_table.setSelectionBehavior(QTableView.SelectRows)
+        self.data_table.setSelectionMode(QTableView.SingleSelection)
 
         # Set fixed row height
         self.data_table.verticalHeader().setDefaultSectionSize(22)
         self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         # Connect double click event
-        self.data_table.itemDoubleClicked.connect(self.on_table_double_click)
+        self.data_table.doubleClicked.connect(self.on_table_double_click)
 
         layout.addWidget(self.data_table)
 
-        # Initialize table with sample data
-        self.refresh_table()
+        # The table is filled after the window is first shown (see showEvent);
+        # until then the model's padding rows show an empty striped table
+        self._table_loaded = False
 
     # Event handlers
+    def showEvent(self, event):
+        """Fill the table once, after the first paint of a shown window"""
+        super().showEvent(event)
+        if not self._table_loaded:
+            self._table_loaded = True
+            QTimer.singleShot(0, self.refresh_table)
+
+    @pyqtSlot(str)
     def on_version_changed(self, text):
         """Handle version selection change"""
         self.selected_version = text
         self.show_status(f"版本已切换到: {text}", True)
 
+    @pyqtSlot(str)
     def on_table_version_changed(self, text):
         """Handle table version selection change"""
         self.selected_table_version = text
         self.refresh_table()
 
-    def on_table_double_click(self, item):
+    @pyqtSlot(QModelIndex)
+    def on_table_double_click(self, index):
         """Handle table double click event"""
-        row = item.row()
-        name_item = self.data_table.item(row, 1)
-        if name_item:
-            self.show_status(f"双击了: {name_item.text()}", True)
-
-    def text_input_key_press_event(self, event):
-        """Handle key press events in text input"""
-        if event.key() == QtCore.Qt.Key_Return or event.key() == QtCore.Qt.Key_Enter:
-            if event.modifiers() & (QtCore.Qt.ControlModifier | QtCore.Qt.MetaModifier):
-                QTextEdit.keyPressEvent(self.text_input, event)
-            else:
+        name = self.table_model.index(index.row(), 1).data()
+        if name:
+            self.show_status(f"双击了: {name}", True)
+
+    def eventFilter(self, obj, event):
+        """Confirm on Return/Enter in text input; Ctrl/Cmd+Return inserts a new line"""
+        if event.type() == _KEY_PRESS and obj is self.text_input:
+            key = event.key()
+            if ((key == _KEY_RETURN or key == _KEY_ENTER)
+                    and not event.modifiers() & _NEWLINE_MODIFIERS):
                 self.confirm_action()
-        else:
-            QTextEdit.keyPressEvent(self.text_input, event)
+                return True
+        return super().eventFilter(obj, event)
 
     def handle_action(self, action_type):
         """Handle action button selection"""
-        self.selected_option = action_type
-        self.update_button_states()
+        self.select_option(action_type)
         self.show_status(f"选择了: {action_type}", True)
 
-    def update_button_states(self):
-        """Update visual states of action buttons"""
-        for action_type, color in self.button_colors.items():
-            if action_type in self.action_buttons:
-                btn = self.action_buttons[action_type]
-                is_selected = (self.selected_option == action_type)
-                self.apply_button_style(btn, color, is_selected)
+    @pyqtSlot(int)
+    def on_action_clicked(self, button_id):
+        """Handle a click in the action button group"""
+        self.handle_action(self.ACTION_BUTTONS_DATA[button_id][1])
+
+    def select_option(self, action_type):
+        """Select an action (or None); the button group keeps the checked state exclusive"""
+        self.selected_option = action_type
+        if action_type in self.action_buttons:
+            self.action_buttons[action_type].setChecked(True)
+            return
+
+        checked_button = self.action_group.checkedButton()
+        if checked_button is not None:
+            # An exclusive group does not let its checked button be unchecked directly
+            self.action_group.setExclusive(False)
+            checked_button.setChecked(False)
+            self.action_group.setExclusive(True)
 
     # Table and data operations
+    def set_table_rows(self, rows):
+        """Replace the table data and encode its versions as integer codes for filtering"""
+        self.table_rows = rows
+        versions, self.table_version_codes = np.unique(rows['version'], return_inverse=True)
+        self.table_version_index = {version: code for code, version in enumerate(versions.tolist())}
+
+    @pyqtSlot()
     def refresh_table(self):
         """Refresh table with sample data"""
         try:
-            # Sample data
-            sample_data = [
-                ("1", "项目A", "完成", "备注1"),
-                ("2", "项目B", "进行中", "备注2"),
-                ("3", "项目C", "待开始", "备注3"),
-            ]
-
             # Filter by version if not 'all'
+            rows = self.table_rows
             if self.selected_table_version != 'all':
-                # Add version-specific filtering logic here
-                pass
-
-            # Set table size
-            row_count = max(12, len(sample_data))
-            self.data_table.setRowCount(row_count)
-
-            # Populate data
-            for row, (id_val, name, status, note) in enumerate(sample_data):
-                self.data_table.setItem(row, 0, QTableWidgetItem(id_val))
-                self.data_table.setItem(row, 1, QTableWidgetItem(name))
-                self.data_table.setItem(row, 2, QTableWidgetItem(status))
-                self.data_table.setItem(row, 3, QTableWidgetItem(note))
-
-            # Fill empty rows
-            for row in range(len(sample_data), row_count):
-                for col in range(4):
-                    self.data_table.setItem(row, col, QTableWidgetItem(""))
-
-            self.data_table.update()
+                code = self.table_version_index.get(self.selected_table_version)
+                if code is None:
+                    rows = rows[:0]
+                else:
+                    rows = rows[version_mask(self.table_version_codes, code)]
+
+            # Swap the rows in with a single model reset (tolist gives plain str tuples)
+            self.table_model.set_rows(rows.tolist())
+            self._table_loaded = True
             self.show_status("表格已刷新", True)
 
         except Exception as e:
             self.show_status("刷新失败", False)
 
+    @pyqtSlot()
     def export_data(self):
         """Export table data"""
         self.show_status("数据已导出", True)
 
     # Action methods
+    @pyqtSlot()
     def confirm_action(self):
         """Handle confirm button click"""
         text_content = self.text_input.toPlainText()
         if self.selected_option and text_content:
             self.show_status(f"执行操作: {self.selected_option}", True)
             self.text_input.clear()
-            self.selected_option = None
-            self.update_button_states()
+            self.select_option(None)
         else:
             self.show_status("请选择操作和输入内容", False)
 
+    @pyqtSlot()
     def cancel_action(self):
         """Handle cancel button click"""
         self.text_input.clear()
-        self.selected_option = None
-        self.update_button_states()
+        self.select_option(None)
         self.show_status("已取消", True)
 
     # UI helper methods
     def show_status(self, message, is_success=True):
         """Show status message with appropriate color"""
-        if is_success:
-            color = "rgb(100, 200, 100)"  # Green for success
-        else:
-            color = "rgb(200, 100, 100)"  # Red for error
-
-        self.status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: 11px;
-                font-style: italic;
-            }}
-        """)
+        self.status_label.setPalette(self._status_palettes[bool(is_success)])
         self.status_label.setText(message)
 
         # Auto clear after 3 seconds
-        from PyQt5.QtCore import QTimer
-        QTimer.singleShot(3000, lambda: self.status_label.setText(""))
-
-    def apply_button_style(self, button, color, is_selected=False):
-        """Apply style to a button"""
-        r, g, b = color
-
-        if is_selected:
-            # Selected state - keep same color but with white border
-            bg_color = f"rgb({r}, {g}, {b})"
-            hover_color = f"rgb({min(255, r+30)}, {min(255, g+30)}, {min(255, b+30)})"
-            border_color = "rgb(255, 255, 255)"
-            border_width = "2px"
-        else:
-            # Normal colors
-            bg_color = f"rgb({r}, {g}, {b})"
-            hover_color = f"rgb({min(255, r+30)}, {min(255, g+30)}, {min(255, b+30)})"
-            border_color = "rgb(100, 100, 100)"
-            border_width = "1px"
-
-        style = f"""
-            QPushButton {{
-                background-color: {bg_color} !important;
-                color: rgb(255, 255, 255);
-                border: {border_width} solid {border_color};
-                border-radius: 15px;
-                font-size: 11px;
-                font-weight: semibold;
-                font-family: 'Open Sans', sans-serif;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color} !important;
-            }}
-            QPushButton:pressed {{
-                background-color: {bg_color} !important;
-            }}
-        """
-        button.setStyleSheet(style)
+        self._status_timer.start(3000)
 
     def add_separator(self, layout):
-        """Add a separator line"""
+        """Add a separator line (styled by QFrame#Separator in APP_QSS)"""
         separator = QFrame()
+        separator.setObjectName("Separator")
         separator.setFrameShape(QFrame.HLine)
-        separator.setFrameShadow(QFrame.Plain)
-        separator.setLineWidth(1)
-        separator.setStyleSheet("background-color: rgb(9, 9, 9); border: none;")
         separator.setFixedHeight(1)
         layout.addWidget(separator)
 
-    def _add_combobox_arrow(self, combobox):
-        """Add custom arrow to combobox"""
-        from PyQt5.QtWidgets import QLabel
-        from PyQt5.QtCore import Qt
-
-        # Create arrow label
-        arrow_label = QLabel("⌄", combobox)
-        arrow_label.setStyleSheet("""
-            QLabel {
-                color: rgb(145, 145, 145);
-                background: transparent;
-                font-size: 10px;
-                border: none;
-            }
-        """)
-        arrow_label.setAlignment(Qt.AlignCenter)
-        arrow_label.setGeometry(55, 4, 15, 12)
-        arrow_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-
-    def setup_styles(self):
-        """Setup button styles and colors"""
-        # Apply colors to each action button
-        for action_type, color in self.button_colors.items():
-            if action_type in self.action_buttons:
-                btn = self.action_buttons[action_type]
-                self.apply_button_style(btn, color, False)
+
+# Dark application palette (role, RGB)
+DARK_PALETTE_COLORS = (
+    (QPalette.Window, (40, 40, 46)),
+    (QPalette.WindowText, (255, 255, 255)),
+    (QPalette.Base, (31, 31, 31)),
+    (QPalette.AlternateBase, (40, 40, 46)),
+    (QPalette.ToolTipBase, (255, 255, 255)),
+    (QPalette.ToolTipText, (255, 255, 255)),
+    (QPalette.Text, (255, 255, 255)),
+    (QPalette.Button, (40, 40, 46)),
+    (QPalette.ButtonText, (255, 255, 255)),
+    (QPalette.BrightText, (255, 0, 0)),
+    (QPalette.Link, (100, 200, 255)),
+    (QPalette.Highlight, (100, 200, 255)),
+    (QPalette.HighlightedText, (0, 0, 0)),
+)
+
+
+@lru_cache(maxsize=None)
+def _build_dark_palette():
+    """Build the dark application palette (built once, then reused)"""
+    palette = QPalette()
+    for role, rgb in DARK_PALETTE_COLORS:
+        palette.setColor(role, QColor(*rgb))
+    return palette
 
 
 def main():
     """Main function"""
-    # Setup application
-    import os
-    import sys
-
     # Ensure stdout/stderr are not redirected
     sys.stdout = sys.__stdout__
     sys.stderr = sys.__stderr__
@@ -643,23 +743,13 @@ def main():
 
     # Set application style
     app.setStyle('Fusion')
+    app.setStyleSheet(APP_QSS)
 
     # Set dark palette
-    palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(40, 40, 46))
-    palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Base, QColor(31, 31, 31))
-    palette.setColor(QPalette.AlternateBase, QColor(40, 40, 46))
-    palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Text, QColor(255, 255, 255))
-    palette.setColor(QPalette.Button, QColor(40, 40, 46))
-    palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-    palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
-    palette.setColor(QPalette.Link, QColor(100, 200, 255))
-    palette.setColor(QPalette.Highlight, QColor(100, 200, 255))
-    palette.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
-    app.setPalette(palette)
+    app.setPalette(_build_dark_palette())
+
+    # Compile the table filter kernel up front so the first filter change is not delayed
+    warm_up_version_mask()
 
     # Create and show main window
     window = DarkUITemplate()
@@ -17,6 +17,7 @@ Usage:
 """
 
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Project setup - add project root to Python path
@@ -29,10 +30,404 @@ from dftt_timecode import DfttTimecode
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
     QWidget, QLabel, QPushButton, QLineEdit, QFrame,
-    QComboBox, QScrollArea, QTextEdit, QTabWidget, QCheckBox
+    QComboBox, QScrollArea, QListWidget, QTabWidget, QCheckBox, QButtonGroup,
+    QAbstractItemView
 )
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QPalette, QColor
+from PyQt5.QtCore import Qt, QTimer, QSignalBlocker
+from PyQt5.QtGui import QPalette, QColor, QFont
+
+# Delay before auto-formatting a timecode input, restarted on every keystroke
+FORMAT_DEBOUNCE_MS = 120
+
+# Combobox entries shared by the converter and calculator tabs
+FPS_CHOICES = ("23.976", "23.98", "24", "25", "29.97", "30", "48", "50", "59.94", "60", "Custom")
+FORMAT_CHOICES = (
+    "SMPTE (HH:MM:SS:FF)",
+    "SRT (HH:MM:SS,mmm)",
+    "DLP (HH:MM:SS:sss)",
+    "FFmpeg (HH:MM:SS.xx)",
+    "FCPX (fraction/s)",
+    "Frame (count)",
+    "Time (seconds)",
+)
+
+# Timecode type of each FORMAT_CHOICES entry, and its input placeholder
+FORMAT_TYPES = ('smpte', 'srt', 'dlp', 'ffmpeg', 'fcpx', 'frame', 'time')
+FORMAT_PLACEHOLDERS = {
+    'smpte': '00:00:00:00',
+    'srt': '00:00:00,000',
+    'dlp': '00:00:00:000',
+    'ffmpeg': '00:00:00.00',
+    'fcpx': '0/1s',
+    'frame': '0',
+    'time': '0.0',
+}
+
+# Short name of each format (its combobox entry up to the space), for history entries
+FORMAT_NAMES = {
+    timecode_type: choice.split(' ', 1)[0]
+    for timecode_type, choice in zip(FORMAT_TYPES, FORMAT_CHOICES)
+}
+
+
+def format_type_at(index):
+    """Timecode type of a format combobox index (SMPTE when out of range)"""
+    return FORMAT_TYPES[index] if 0 <= index < len(FORMAT_TYPES) else 'smpte'
+
+
+# Converter result rows as (format, name, description), common formats first
+RESULT_FORMATS = (
+    ('frame', 'Frame Count', 'frames'),
+    ('time', 'Time', 'seconds'),
+    ('smpte', 'SMPTE', 'HH:MM:SS:FF'),
+    ('srt', 'SRT', 'HH:MM:SS,mmm'),
+    ('dlp', 'DLP', 'HH:MM:SS:sss'),
+    ('ffmpeg', 'FFmpeg', 'HH:MM:SS.xx'),
+    ('fcpx', 'FCPX', 'fraction/s'),
+)
+
+# Number of calculations kept in the calculator history
+HISTORY_LIMIT = 10
+
+# Digit fields of the fixed-layout formats as (width, separator)
+TIMECODE_FIELDS = {
+    'smpte': ((2, ':'), (2, ':'), (2, ':'), (2, '')),   # HH:MM:SS:FF
+    'srt': ((2, ':'), (2, ':'), (2, ','), (3, '')),     # HH:MM:SS,mmm
+    'dlp': ((2, ':'), (2, ':'), (2, ':'), (3, '')),     # HH:MM:SS:sss
+    'ffmpeg': ((2, ':'), (2, ':'), (2, '.'), (2, '')),  # HH:MM:SS.xx
+}
+
+
+def smpte_frame_digits(fps):
+    """Number of SMPTE frame (FF) digits needed at the given FPS"""
+    if fps >= 1000:
+        return 4
+    if fps >= 100:
+        return 3
+    return 2
+
+
+@lru_cache(maxsize=None)
+def drop_frame_support(fps):
+    """(drop-framable, forced) for an FPS, computed once per FPS value
+
+    Drop frame is allowed for multiples of 29.97 and 23.98, using the same
+    rounding and modulo as DfttTimecode so the checkbox matches what it
+    accepts; 23.98 always uses drop frame.
+    """
+    is_drop_framable = (round(fps, 2) % 29.97 == 0 or round(fps, 2) % 23.98 == 0)
+    return is_drop_framable, abs(fps - 23.98) < 0.01
+
+
+@lru_cache(maxsize=None)
+def timecode_input_mask(timecode_type, fps):
+    """QLineEdit input mask for a fixed-layout format ('' for the free-form formats)"""
+    fields = TIMECODE_FIELDS.get(timecode_type)
+    if fields is None:
+        return ''
+    if timecode_type == 'smpte':
+        fields = fields[:-1] + ((smpte_frame_digits(fps), ''),)
+    return ''.join('0' * width + separator for width, separator in fields) + ';_'
+
+
+def fits_input_mask(text, mask):
+    """Whether an input mask can hold text unchanged ('' always fits)
+
+    Converted timecodes can fall outside the fixed layout, e.g. a negative
+    value or 100+ hours; a mask would silently rewrite those.
+    """
+    if not text:
+        return True
+    layout = mask.partition(';')[0]
+    return len(text) == len(layout) and all(
+        char.isdigit() if slot == '0' else char == slot
+        for char, slot in zip(text, layout))
+
+
+class _DigitFilter(dict):
+    """str.translate table that deletes every non-digit character not in keep"""
+
+    def __init__(self, keep=''):
+        super().__init__()
+        self.keep = frozenset(keep)
+
+    def __missing__(self, code):
+        # Decide each code point once, later lookups hit the dict directly
+        char = chr(code)
+        value = code if char.isdigit() or char in self.keep else None
+        self[code] = value
+        return value
+
+
+DIGITS_ONLY = _DigitFilter()
+
+# Characters kept in FCPX (fraction/s) and decimal (seconds, FPS) input
+FCPX_CHARS_ONLY = _DigitFilter('/s')
+DECIMAL_CHARS_ONLY = _DigitFilter('.')
+
+
+def clean_decimal_input(text):
+    """Keep the digits and the first '.' of a decimal input (e.g. custom FPS)"""
+    head, dot, tail = text.translate(DECIMAL_CHARS_ONLY).partition('.')
+    return head + dot + tail.replace('.', '')
+
+
+def clean_time_input(text):
+    """Keep the digits, the first '.' and a leading '-' of a time input"""
+    sign = '-' if text.startswith('-') else ''
+    return sign + clean_decimal_input(text)
+
+
+@lru_cache(maxsize=64)
+def _parse_timecode(text, timecode_type, fps, drop_frame, strict):
+    """Parse a timecode string, memoized (callers must not mutate the result)"""
+    return DfttTimecode(text, timecode_type=timecode_type, fps=fps,
+                        drop_frame=drop_frame, strict=strict)
+
+
+@lru_cache(maxsize=128)
+def _convert_timecode(text, from_type, to_type, fps, drop_frame, strict):
+    """Output a timecode string in another format, memoized like _parse_timecode"""
+    return _parse_timecode(text, from_type, fps, drop_frame, strict).timecode_output(to_type)
+
+
+@lru_cache(maxsize=128)
+def _timecode_outputs(text, timecode_type, fps, drop_frame, strict):
+    """Outputs of a timecode string in every RESULT_FORMATS format, memoized"""
+    tc = _parse_timecode(text, timecode_type, fps, drop_frame, strict)
+    return tuple(tc.timecode_output(format_key) for format_key, _, _ in RESULT_FORMATS)
+
+
+def warm_up_timecode():
+    """Run the first DfttTimecode parse/output before the user's first conversion"""
+    _timecode_outputs('00:00:00:00', 'smpte', 25, False, True)
+
+
+# Image assets referenced from APP_QSS, kept next to the script so they are
+# packaged with it
+_ASSETS_DIR = Path(__file__).resolve().parent / "assets"
+_COMBO_ARROW_IMAGE = _ASSETS_DIR / "down_arrow.svg"
+
+# Combobox arrow drawn from an image instead of an overlay label; without the
+# image the rule is left out and Qt draws its default arrow
+_COMBO_ARROW_QSS = f"""
+    QComboBox::down-arrow {{
+        image: url("{_COMBO_ARROW_IMAGE.as_posix()}");
+        width: 8px;
+        height: 5px;
+        right: 8px;
+    }}""" if _COMBO_ARROW_IMAGE.is_file() else ""
+
+# Application font, set once in main(); the stylesheet only adjusts its size
+# and weight per widget (the monospace fields excepted)
+UI_FONT_FAMILY = 'Open Sans'
+
+# Application-wide stylesheet, applied once in main(); widgets pick their
+# rules (and the fixed heights of labels, fields and separators) up through
+# their object names instead of per-widget setStyleSheet/setFixedHeight.
+# min/max-height is the content height, i.e. without padding and border
+APP_QSS = """
+    QWidget {
+        background-color: rgb(40, 40, 46);
+    }
+    QLabel#TitleLabel {
+        color: rgb(255, 255, 255);
+        font-size: 16px;
+        font-weight: regular;
+    }
+    QLabel#DescLabel {
+        color: rgb(145, 145, 145);
+        font-size: 11px;
+        font-style: italic;
+    }
+    QLabel#FieldLabel {
+        color: rgb(145, 145, 145);
+        font-size: 14px;
+        font-weight: semibold;
+    }
+    QLabel#FormatLabel {
+        color: rgb(145, 145, 145);
+        font-size: 12px;
+    }
+    QLabel#FieldLabel, QLabel#FormatLabel {
+        min-height: 15px;
+        max-height: 15px;
+    }
+    QLabel#StatusLabel {
+        color: rgb(200, 100, 100);
+        font-size: 11px;
+        font-style: italic;
+        min-height: 20px;
+        max-height: 20px;
+    }
+    QFrame#Separator {
+        background-color: rgb(9, 9, 9);
+        border: none;
+        min-height: 1px;
+        max-height: 1px;
+    }
+    QPushButton {
+        background-color: rgb(40, 40, 46);
+        color: rgb(145, 145, 145);
+        border: 1px solid rgb(100, 100, 100);
+        border-radius: 12px;
+        font-size: 11px;
+        font-weight: semibold;
+    }
+    QPushButton:hover {
+        background-color: rgb(53, 53, 58);
+    }
+    QPushButton:pressed {
+        background-color: rgb(23, 23, 28);
+    }
+    QPushButton#OperationButton:checked {
+        background-color: rgb(100, 200, 255);
+        color: rgb(255, 255, 255);
+        border: 2px solid rgb(255, 255, 255);
+    }
+    QPushButton#OperationButton:checked:hover {
+        background-color: rgb(120, 210, 255);
+    }
+    QPushButton#ToggleButton {
+        background-color: transparent;
+        color: rgb(145, 145, 145);
+        border: none;
+        text-align: left;
+        padding-left: 0px;
+        font-size: 11px;
+        min-height: 20px;
+        max-height: 20px;
+    }
+    QPushButton#ToggleButton:hover {
+        color: rgb(100, 200, 255);
+    }
+    QWidget#OptionsContent {
+        background-color: rgb(35, 35, 40);
+        border-radius: 3px;
+    }
+    QLineEdit#InputField, QLineEdit#FpsInput, QLineEdit#ResultField,
+    QListWidget#HistoryDisplay {
+        font-family: 'Courier New', 'Monaco', monospace;
+    }
+    QLineEdit#InputField, QLineEdit#FpsInput {
+        background-color: rgb(31, 31, 31);
+        color: rgb(200, 200, 200);
+        border: 1px solid rgb(7, 7, 7);
+        border-radius: 3px;
+        padding: 5px 8px;
+        font-size: 14px;
+    }
+    QLineEdit#InputField:focus, QLineEdit#FpsInput:focus {
+        border: 1px solid rgb(100, 200, 255);
+    }
+    QLineEdit#InputField {
+        min-height: 23px;
+        max-height: 23px;
+    }
+    QLineEdit#ResultField {
+        background-color: rgb(31, 31, 31);
+        color: rgb(100, 200, 100);
+        border: 1px solid rgb(7, 7, 7);
+        border-radius: 3px;
+        padding: 8px;
+        font-size: 18px;
+        font-weight: bold;
+        min-height: 22px;
+        max-height: 22px;
+    }
+    QComboBox {
+        background-color: rgb(31, 31, 31);
+        color: rgb(145, 145, 145);
+        border: 1px solid rgb(7, 7, 7);
+        border-radius: 3px;
+        padding: 3px 8px;
+        font-size: 12px;
+    }
+    QComboBox::drop-down {
+        border: none;
+        background: transparent;
+    }
+    QComboBox QAbstractItemView {
+        background-color: rgb(31, 31, 31);
+        color: rgb(145, 145, 145);
+        border: 1px solid rgb(7, 7, 7);
+        selection-background-color: rgb(100, 200, 255);
+    }
+    QCheckBox {
+        color: rgb(145, 145, 145);
+        font-size: 12px;
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 1px solid rgb(100, 100, 100);
+        border-radius: 3px;
+        background-color: rgb(31, 31, 31);
+    }
+    QCheckBox::indicator:hover {
+        border: 1px solid rgb(100, 200, 255);
+    }
+    QCheckBox::indicator:checked {
+        background-color: rgb(100, 200, 255);
+        border: 1px solid rgb(100, 200, 255);
+    }
+    QListWidget#HistoryDisplay {
+        background-color: rgb(31, 31, 31);
+        color: rgb(145, 145, 145);
+        border: 1px solid rgb(7, 7, 7);
+        border-radius: 3px;
+        padding: 5px;
+        font-size: 11px;
+        min-height: 108px;
+        max-height: 108px;
+    }
+    QScrollArea#ResultsScroll {
+        background-color: rgb(40, 40, 46);
+        border: none;
+    }
+    QScrollArea#ResultsScroll QScrollBar:vertical {
+        background: transparent;
+        width: 8px;
+        border: none;
+    }
+    QScrollArea#ResultsScroll QScrollBar::handle:vertical {
+        background: rgb(90, 95, 102);
+        min-height: 20px;
+        border-radius: 4px;
+        margin: 0px;
+    }
+    QScrollArea#ResultsScroll QScrollBar::handle:vertical:hover {
+        background: rgb(110, 115, 122);
+    }
+    QScrollArea#ResultsScroll QScrollBar::add-line:vertical,
+    QScrollArea#ResultsScroll QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+        height: 0px;
+    }
+    QTabWidget::pane {
+        border: 1px solid rgb(9, 9, 9);
+        background-color: rgb(40, 40, 46);
+        border-radius: 3px;
+    }
+    QTabBar::tab {
+        background-color: rgb(31, 31, 31);
+        color: rgb(145, 145, 145);
+        border: 1px solid rgb(9, 9, 9);
+        border-bottom: none;
+        padding: 8px 16px;
+        margin-right: 2px;
+        font-size: 12px;
+    }
+    QTabBar::tab:selected {
+        background-color: rgb(40, 40, 46);
+        color: rgb(255, 255, 255);
+        border-bottom: 2px solid rgb(100, 200, 255);
+    }
+    QTabBar::tab:hover {
+        background-color: rgb(53, 53, 58);
+    }""" + _COMBO_ARROW_QSS + "\n"
 
 
 class TimecodeConverterWidget(QWidget):
@@ -52,110 +447,11 @@ class TimecodeConverterWidget(QWidget):
         self.drop_frame = False
         self.options_expanded = False
 
-        # Get shared styles from parent
-        if isinstance(parent, QTabWidget) and hasattr(parent.parent(), 'common_styles'):
-            self.common_styles = parent.parent().common_styles
-        else:
-            self._init_styles()
+        # Input and settings of the results currently displayed
+        self._last_convert_key = None
 
         self.setup_ui()
 
-    def _init_styles(self):
-        """Initialize common UI styles (fallback if no parent)"""
-        self.common_styles = {
-            'label_style': "color: rgb(145, 145, 145); font-size: 14px; font-weight: semibold; font-family: 'Open Sans', sans-serif;",
-            'button_style': """
-                QPushButton {
-                    background-color: rgb(40, 40, 46);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 12px;
-                    font-size: 11px;
-                    font-weight: semibold;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QPushButton:hover {
-                    background-color: rgb(53, 53, 58);
-                }
-                QPushButton:pressed {
-                    background-color: rgb(23, 23, 28);
-                }
-            """,
-            'input_style': """
-                QLineEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(200, 200, 200);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 5px 8px;
-                    font-size: 14px;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-                QLineEdit:focus {
-                    border: 1px solid rgb(100, 200, 255);
-                }
-            """,
-            'result_style': """
-                QLineEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(100, 200, 100);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 8px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-            """,
-            'combobox_style': """
-                QComboBox {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 3px 8px;
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    background: transparent;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border: none;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    selection-background-color: rgb(100, 200, 255);
-                }
-            """,
-            'checkbox_style': """
-                QCheckBox {
-                    color: rgb(145, 145, 145);
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                    spacing: 8px;
-                }
-                QCheckBox::indicator {
-                    width: 16px;
-                    height: 16px;
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 3px;
-                    background-color: rgb(31, 31, 31);
-                }
-                QCheckBox::indicator:hover {
-                    border: 1px solid rgb(100, 200, 255);
-                }
-                QCheckBox::indicator:checked {
-                    background-color: rgb(100, 200, 255);
-                    border: 1px solid rgb(100, 200, 255);
-                }
-            """
-        }
-
     def setup_ui(self):
         """Setup UI interface"""
         main_layout = QVBoxLayout(self)
@@ -167,7 +463,6 @@ class TimecodeConverterWidget(QWidget):
 
         # Advanced options (expandable)
         self.setup_advanced_options(main_layout)
-        self.update_strict_mode_availability()
         self.update_drop_frame_availability()
 
         self.add_separator(main_layout)
@@ -194,15 +489,13 @@ class TimecodeConverterWidget(QWidget):
         label_layout.setSpacing(10)
 
         fps_label = QLabel("Frame Rate")
-        fps_label.setStyleSheet(self.common_styles['label_style'])
-        fps_label.setFixedHeight(15)
+        fps_label.setObjectName("FieldLabel")
         label_layout.addWidget(fps_label)
 
         label_layout.addStretch()
 
         format_label = QLabel("Input Format")
-        format_label.setStyleSheet(self.common_styles['label_style'])
-        format_label.setFixedHeight(15)
+        format_label.setObjectName("FieldLabel")
         label_layout.addWidget(format_label)
 
         label_widget = QWidget()
@@ -216,18 +509,16 @@ class TimecodeConverterWidget(QWidget):
 
         self.fps_combo = QComboBox()
         self.fps_combo.setFixedSize(120, 25)
-        self.fps_combo.addItems(["23.976", "23.98", "24", "25", "29.97", "30", "48", "50", "59.94", "60", "Custom"])
+        self.fps_combo.addItems(FPS_CHOICES)
         self.fps_combo.setCurrentText("25")
-        self.fps_combo.setStyleSheet(self.common_styles['combobox_style'])
         self.fps_combo.currentTextChanged.connect(self.on_fps_changed)
-        self._add_combobox_arrow(self.fps_combo)
         combo_layout.addWidget(self.fps_combo)
 
         # Custom FPS input (initially hidden)
         self.custom_fps_input = QLineEdit()
         self.custom_fps_input.setFixedSize(120, 25)
         self.custom_fps_input.setPlaceholderText("Enter FPS")
-        self.custom_fps_input.setStyleSheet(self.common_styles['input_style'])
+        self.custom_fps_input.setObjectName("FpsInput")
         self.custom_fps_input.setVisible(False)
         self.custom_fps_input.textChanged.connect(self.on_custom_fps_changed)
         self.custom_fps_input.returnPressed.connect(self.apply_custom_fps)
@@ -237,19 +528,9 @@ class TimecodeConverterWidget(QWidget):
 
         self.format_combo = QComboBox()
         self.format_combo.setFixedSize(150, 25)
-        self.format_combo.addItems([
-            "SMPTE (HH:MM:SS:FF)",
-            "SRT (HH:MM:SS,mmm)",
-            "DLP (HH:MM:SS:sss)",
-            "FFmpeg (HH:MM:SS.xx)",
-            "FCPX (fraction/s)",
-            "Frame (count)",
-            "Time (seconds)"
-        ])
+        self.format_combo.addItems(FORMAT_CHOICES)
         self.format_combo.setCurrentIndex(0)
-        self.format_combo.setStyleSheet(self.common_styles['combobox_style'])
         self.format_combo.currentIndexChanged.connect(self.on_format_changed)
-        self._add_combobox_arrow(self.format_combo, arrow_x=120)
         combo_layout.addWidget(self.format_combo)
 
         combo_widget = QWidget()
@@ -269,75 +550,63 @@ class TimecodeConverterWidget(QWidget):
         toggle_layout.setContentsMargins(0, 0, 0, 0)
 
         self.toggle_btn = QPushButton("▶ Advanced Options")
-        self.toggle_btn.setFixedHeight(20)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: rgb(145, 145, 145);
-                border: none;
-                text-align: left;
-                padding-left: 0px;
-                font-size: 11px;
-                font-family: 'Open Sans', sans-serif;
-            }
-            QPushButton:hover {
-                color: rgb(100, 200, 255);
-            }
-        """)
+        self.toggle_btn.setObjectName("ToggleButton")
         self.toggle_btn.clicked.connect(self.toggle_advanced_options)
         toggle_layout.addWidget(self.toggle_btn)
         toggle_layout.addStretch()
 
         options_layout.addLayout(toggle_layout)
 
-        # Collapsible content
+        # The checkboxes are only built on first expand (see ensure_options),
+        # until then the settings live in strict_mode/drop_frame alone
+        self.options_content = None
+        self.options_container = options_container
+
+        layout.addWidget(options_container)
+
+    def ensure_options(self):
+        """Build the collapsible option checkboxes on first expand"""
+        if self.options_content is not None:
+            return
+
         self.options_content = QWidget()
-        self.options_content.setObjectName("options_content")
-        self.options_content.setStyleSheet("""
-            QWidget#options_content {
-                background-color: rgb(35, 35, 40);
-                border-radius: 3px;
-            }
-        """)
+        self.options_content.setObjectName("OptionsContent")
         content_layout = QHBoxLayout(self.options_content)
         content_layout.setContentsMargins(10, 8, 10, 8)
         content_layout.setSpacing(15)
 
         # Strict Mode checkbox
         self.strict_mode_cb = QCheckBox("Strict Mode")
-        self.strict_mode_cb.setChecked(True)
-        self.strict_mode_cb.setStyleSheet(self.common_styles['checkbox_style'])
-        self.strict_mode_cb.stateChanged.connect(self.on_strict_mode_changed)
         content_layout.addWidget(self.strict_mode_cb)
 
         # Drop Frame checkbox
         self.drop_frame_cb = QCheckBox("Drop Frame")
-        self.drop_frame_cb.setStyleSheet(self.common_styles['checkbox_style'])
-        self.drop_frame_cb.stateChanged.connect(self.on_drop_frame_changed)
         content_layout.addWidget(self.drop_frame_cb)
 
         content_layout.addStretch()
 
-        options_layout.addWidget(self.options_content)
+        self.options_container.layout().addWidget(self.options_content)
 
-        # Initially hide the options
-        self.options_content.setMaximumHeight(0)
-        self.options_content.setVisible(False)
-
-        layout.addWidget(options_container)
+        # Pick up the current settings before listening for user changes
+        self.update_option_checkboxes()
+        self.strict_mode_cb.stateChanged.connect(self.on_strict_mode_changed)
+        self.drop_frame_cb.stateChanged.connect(self.on_drop_frame_changed)
 
     def toggle_advanced_options(self):
         """Toggle advanced options visibility"""
         self.options_expanded = not self.options_expanded
 
-        if self.options_expanded:
-            self.toggle_btn.setText("▼ Advanced Options")
-            self.options_content.setMaximumHeight(16777215)
-            self.options_content.setVisible(True)
-        else:
-            self.toggle_btn.setText("▶ Advanced Options")
-            self.options_content.setVisible(False)
-            self.options_content.setMaximumHeight(0)
+        # Repaint once after the button and the section have both changed
+        self.setUpdatesEnabled(False)
+        try:
+            if self.options_expanded:
+                self.ensure_options()
+                self.toggle_btn.setText("▼ Advanced Options")
+            else:
+                self.toggle_btn.setText("▶ Advanced Options")
+            self.options_content.setVisible(self.options_expanded)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def on_strict_mode_changed(self, state):
         """Handle strict mode checkbox change"""
@@ -347,153 +616,107 @@ class TimecodeConverterWidget(QWidget):
         """Handle drop frame checkbox change"""
         self.drop_frame = (state == Qt.Checked)
 
-    def update_strict_mode_availability(self):
-        """Strict mode is always available for user control"""
-        # Strict mode is always enabled for user control, no forced behavior
-        self.strict_mode_cb.setEnabled(True)
-
     def update_drop_frame_availability(self):
         """Enable/disable drop frame based on fps (force enable for 23.98)"""
-        fps = self.current_fps
-        is_drop_framable = (round(fps, 2) % 29.97 == 0 or round(fps, 2) % 23.98 == 0)
-
-        # Check if fps is 23.98
-        is_23_98 = (abs(fps - 23.98) < 0.01)
+        is_drop_framable, is_23_98 = drop_frame_support(self.current_fps)
 
         if is_23_98:
-            # Force enable drop frame for 23.98 and disable checkbox
-            self.drop_frame_cb.setChecked(True)
-            self.drop_frame_cb.setEnabled(False)
+            # Force enable drop frame for 23.98
             self.drop_frame = True
-        elif is_drop_framable:
-            # Enable checkbox for user control
-            self.drop_frame_cb.setEnabled(True)
-        else:
+        elif not is_drop_framable:
             # Disable drop frame for non-drop-framable rates
-            self.drop_frame_cb.setEnabled(False)
-            if self.drop_frame:
-                self.drop_frame_cb.setChecked(False)
-                self.drop_frame = False
+            self.drop_frame = False
+        self.update_option_checkboxes()
+
+    def update_option_checkboxes(self):
+        """Mirror strict/drop frame settings onto the checkboxes, if built"""
+        if self.options_content is None:
+            return
+
+        is_drop_framable, is_23_98 = drop_frame_support(self.current_fps)
+        # Strict mode is always enabled for user control, no forced behavior
+        self.strict_mode_cb.setChecked(self.strict_mode)
+        self.drop_frame_cb.setChecked(self.drop_frame)
+        # Only user-controllable for drop-framable rates other than 23.98
+        self.drop_frame_cb.setEnabled(is_drop_framable and not is_23_98)
 
     def setup_input_section(self, layout):
         """Setup input section"""
         input_label = QLabel("Input Timecode")
-        input_label.setStyleSheet(self.common_styles['label_style'])
-        input_label.setFixedHeight(15)
+        input_label.setObjectName("FieldLabel")
         layout.addWidget(input_label)
 
         self.input_field = QLineEdit()
         self.input_field.setPlaceholderText("00:00:00:00")
-        self.input_field.setStyleSheet(self.common_styles['input_style'])
-        self.input_field.setFixedHeight(35)
-        self.input_field.textChanged.connect(self.format_timecode_input)
+        self.input_field.setObjectName("InputField")
+        self._fmt_timer = QTimer(self)
+        self._fmt_timer.setSingleShot(True)
+        self._fmt_timer.setInterval(FORMAT_DEBOUNCE_MS)
+        self._fmt_timer.timeout.connect(self.format_timecode_input)
+        # Each keystroke only restarts the debounce timer (free-form formats only)
+        self.input_field.textChanged.connect(self._fmt_timer.start)
+        self.apply_input_mask()
         self.input_field.returnPressed.connect(self.convert_timecode)
         layout.addWidget(self.input_field)
 
         # Status label for errors
         self.status_label = QLabel("")
-        self.status_label.setFixedHeight(20)
+        self.status_label.setObjectName("StatusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: rgb(200, 100, 100);
-                font-size: 11px;
-                font-style: italic;
-            }
-        """)
         layout.addWidget(self.status_label)
 
     def setup_convert_button(self, layout):
         """Setup convert button"""
         self.convert_btn = QPushButton("Convert")
         self.convert_btn.setFixedHeight(25)
-        self.convert_btn.setStyleSheet(self.common_styles['button_style'])
         self.convert_btn.clicked.connect(self.convert_timecode)
         layout.addWidget(self.convert_btn)
 
     def setup_results_section(self, layout):
         """Setup results section with all format outputs"""
         results_label = QLabel("Converted Results")
-        results_label.setStyleSheet(self.common_styles['label_style'])
-        results_label.setFixedHeight(15)
+        results_label.setObjectName("FieldLabel")
         layout.addWidget(results_label)
 
         # Create scroll area for results
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: rgb(40, 40, 46);
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 8px;
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                background: rgb(90, 95, 102);
-                min-height: 20px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgb(110, 115, 122);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-        """)
+        scroll_area.setObjectName("ResultsScroll")
 
         # Container widget for results
-        results_container = QWidget()
-        results_layout = QVBoxLayout(results_container)
+        self.results_container = QWidget()
+        results_layout = QVBoxLayout(self.results_container)
         results_layout.setContentsMargins(0, 0, 0, 0)
         results_layout.setSpacing(8)
 
-        # Dictionary to store result displays
-        self.result_displays = {}
-
-        # Define all formats with their display names (common formats first)
-        formats = [
-            ('frame', 'Frame Count', 'frames'),
-            ('time', 'Time', 'seconds'),
-            ('smpte', 'SMPTE', 'HH:MM:SS:FF'),
-            ('srt', 'SRT', 'HH:MM:SS,mmm'),
-            ('dlp', 'DLP', 'HH:MM:SS:sss'),
-            ('ffmpeg', 'FFmpeg', 'HH:MM:SS.xx'),
-            ('fcpx', 'FCPX', 'fraction/s')
-        ]
-
-        for format_key, format_name, format_desc in formats:
+        # Result displays, in RESULT_FORMATS order
+        result_displays = []
+
+        for _, format_name, format_desc in RESULT_FORMATS:
             # Format label
             format_label = QLabel(f"{format_name} ({format_desc})")
-            format_label.setStyleSheet("color: rgb(145, 145, 145); font-size: 12px; font-family: 'Open Sans', sans-serif;")
-            format_label.setFixedHeight(15)
+            format_label.setObjectName("FormatLabel")
             results_layout.addWidget(format_label)
 
             # Result display
             result_display = QLineEdit()
             result_display.setReadOnly(True)
             result_display.setPlaceholderText("--")
-            result_display.setStyleSheet(self.common_styles['result_style'])
-            result_display.setFixedHeight(40)
+            result_display.setObjectName("ResultField")
             result_display.setAlignment(Qt.AlignCenter)
             results_layout.addWidget(result_display)
 
             # Store reference
-            self.result_displays[format_key] = result_display
+            result_displays.append(result_display)
 
+        self.result_displays = tuple(result_displays)
         results_layout.addStretch()
-        scroll_area.setWidget(results_container)
+        scroll_area.setWidget(self.results_container)
         layout.addWidget(scroll_area)
 
         # Clear button
         clear_btn = QPushButton("Clear All")
         clear_btn.setFixedHeight(25)
-        clear_btn.setStyleSheet(self.common_styles['button_style'])
         clear_btn.clicked.connect(self.clear_all)
         layout.addWidget(clear_btn)
 
@@ -503,25 +726,9 @@ class TimecodeConverterWidget(QWidget):
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Plain)
         separator.setLineWidth(1)
-        separator.setStyleSheet("background-color: rgb(9, 9, 9); border: none;")
-        separator.setFixedHeight(1)
+        separator.setObjectName("Separator")
         layout.addWidget(separator)
 
-    def _add_combobox_arrow(self, combobox, arrow_x=90):
-        """Add custom arrow to combobox"""
-        arrow_label = QLabel("⌄", combobox)
-        arrow_label.setStyleSheet("""
-            QLabel {
-                color: rgb(145, 145, 145);
-                background: transparent;
-                font-size: 10px;
-                border: none;
-            }
-        """)
-        arrow_label.setAlignment(Qt.AlignCenter)
-        arrow_label.setGeometry(arrow_x, 4, 15, 12)
-        arrow_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-
     # Event handlers
     def on_fps_changed(self, text):
         """Handle FPS change"""
@@ -535,30 +742,23 @@ class TimecodeConverterWidget(QWidget):
             self.custom_fps_input.setVisible(False)
             try:
                 self.current_fps = float(text)
-                self.update_strict_mode_availability()
+                self.update_input_mask()
                 self.update_drop_frame_availability()
-                if self.input_field.text().strip():
+                if self.input_text():
                     self.convert_timecode()
             except ValueError:
                 self.current_fps = 25
+                self.update_input_mask()
 
     def on_custom_fps_changed(self, text):
         """Handle custom FPS input change"""
         # Only allow digits and decimal point
-        allowed = ''
-        has_dot = False
-        for c in text:
-            if c.isdigit():
-                allowed += c
-            elif c == '.' and not has_dot:
-                allowed += c
-                has_dot = True
+        allowed = clean_decimal_input(text)
 
         if allowed != text:
-            # Temporarily disconnect to avoid recursive calls
-            self.custom_fps_input.textChanged.disconnect()
-            self.custom_fps_input.setText(allowed)
-            self.custom_fps_input.textChanged.connect(self.on_custom_fps_changed)
+            # Block signals to avoid recursive calls
+            with QSignalBlocker(self.custom_fps_input):
+                self.custom_fps_input.setText(allowed)
             return
 
         # Auto-apply custom FPS if valid
@@ -567,9 +767,9 @@ class TimecodeConverterWidget(QWidget):
                 fps = float(allowed)
                 if fps > 0 and fps <= 1000:  # Reasonable FPS range
                     self.current_fps = fps
-                    self.update_strict_mode_availability()
+                    self.update_input_mask()
                     self.update_drop_frame_availability()
-                    if self.input_field.text().strip():
+                    if self.input_text():
                         self.convert_timecode()
                     self.status_label.clear()
             except ValueError:
@@ -583,9 +783,9 @@ class TimecodeConverterWidget(QWidget):
                 fps = float(text)
                 if fps > 0 and fps <= 1000:  # Reasonable FPS range
                     self.current_fps = fps
-                    self.update_strict_mode_availability()
+                    self.update_input_mask()
                     self.update_drop_frame_availability()
-                    if self.input_field.text().strip():
+                    if self.input_text():
                         self.convert_timecode()
                     self.status_label.clear()
                 else:
@@ -595,36 +795,59 @@ class TimecodeConverterWidget(QWidget):
 
     def on_format_changed(self, index):
         """Handle format change"""
-        format_map = {
-            0: 'smpte',
-            1: 'srt',
-            2: 'dlp',
-            3: 'ffmpeg',
-            4: 'fcpx',
-            5: 'frame',
-            6: 'time'
-        }
-        self.current_format = format_map.get(index, 'smpte')
+        # Finish formatting text typed in the old format first
+        self.flush_pending_format()
+        self.current_format = format_type_at(index)
 
-        # Update placeholder text based on format
-        placeholder_map = {
-            'smpte': '00:00:00:00',
-            'srt': '00:00:00,000',
-            'dlp': '00:00:00:000',
-            'ffmpeg': '00:00:00.00',
-            'fcpx': '0/1s',
-            'frame': '0',
-            'time': '0.0'
-        }
-        placeholder = placeholder_map.get(self.current_format, '00:00:00:00')
+        # Update placeholder text and input mask based on format
+        placeholder = FORMAT_PLACEHOLDERS[self.current_format]
         self.input_field.setPlaceholderText(placeholder)
+        self.update_input_mask()
 
         self.status_label.clear()
 
+    def input_text(self):
+        """Entered input text, '' when it holds no digits"""
+        text = self.input_field.text().strip()
+        if not text.translate(DIGITS_ONLY):
+            # Nothing to parse, e.g. an empty masked field (':::') or a lone '-'
+            return ''
+        return text
+
+    def apply_input_mask(self):
+        """Set the input mask of the current format (none for free-form formats)
+
+        Masked input is formatted by Qt itself, so the auto-format timer is
+        only connected to textChanged while the field has no mask.
+        """
+        mask = timecode_input_mask(self.current_format, self.current_fps)
+        old_mask = self.input_field.inputMask()
+        if old_mask == mask:
+            return
+        self.input_field.setInputMask(mask)
+
+        if not mask:
+            self.input_field.textChanged.connect(self._fmt_timer.start)
+        elif not old_mask:
+            self._fmt_timer.stop()
+            self.input_field.textChanged.disconnect(self._fmt_timer.start)
+
+    def update_input_mask(self):
+        """Re-apply the input mask after a format or FPS change"""
+        with QSignalBlocker(self.input_field):
+            self.apply_input_mask()
+
+    def flush_pending_format(self):
+        """Run a pending auto-format immediately (e.g. before converting)"""
+        if self._fmt_timer.isActive():
+            self._fmt_timer.stop()
+            self.format_timecode_input()
+
     def format_timecode_input(self):
         """Auto-format timecode input based on selected format"""
-        # Temporarily disconnect to avoid recursive calls
-        self.input_field.textChanged.disconnect()
+        if self.input_field.inputMask():
+            # Fixed-layout formats are formatted by the input mask as typed
+            return
 
         # Get current text and cursor position
         text = self.input_field.text()
@@ -633,157 +856,57 @@ class TimecodeConverterWidget(QWidget):
         formatted = text
         new_pos = cursor_pos
 
-        if self.current_format == 'smpte':
-            # SMPTE: HH:MM:SS:FF (FF can be 2-4 digits based on FPS)
-            # Determine max frame digits based on FPS
-            if self.current_fps >= 1000:
-                max_frame_digits = 4
-                max_total_digits = 10
-            elif self.current_fps >= 100:
-                max_frame_digits = 3
-                max_total_digits = 9
-            else:
-                max_frame_digits = 2
-                max_total_digits = 8
-
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:max_total_digits]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i in [1, 3, 5] and i < len(digits_only) - 1:
-                    formatted += ':'
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'srt':
-            # SRT: HH:MM:SS,mmm
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:9]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i == 1 or i == 3:
-                    formatted += ':'
-                elif i == 5 and i < len(digits_only) - 1:
-                    formatted += ','
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'dlp':
-            # DLP: HH:MM:SS:sss
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:9]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i in [1, 3, 5] and i < len(digits_only) - 1:
-                    formatted += ':'
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'ffmpeg':
-            # FFmpeg: HH:MM:SS.xx
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:8]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i == 1 or i == 3:
-                    formatted += ':'
-                elif i == 5 and i < len(digits_only) - 1:
-                    formatted += '.'
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'fcpx':
+        if self.current_format == 'fcpx':
             # FCPX: fraction/s format
-            allowed = ''.join(c for c in text if c.isdigit() or c in ['/', 's'])
-            formatted = allowed
+            formatted = text.translate(FCPX_CHARS_ONLY)
             new_pos = min(cursor_pos, len(formatted))
 
         elif self.current_format == 'frame':
             # Frame: digits only
-            digits_only = ''.join(filter(str.isdigit, text))
+            digits_only = text.translate(DIGITS_ONLY)
             formatted = digits_only
             new_pos = min(cursor_pos, len(formatted))
 
         elif self.current_format == 'time':
             # Time: decimal number
-            allowed = ''
-            has_dot = False
-            for i, c in enumerate(text):
-                if c.isdigit():
-                    allowed += c
-                elif c == '.' and not has_dot:
-                    allowed += c
-                    has_dot = True
-                elif c == '-' and i == 0:
-                    allowed += c
-            formatted = allowed
+            formatted = clean_time_input(text)
             new_pos = min(cursor_pos, len(formatted))
 
-        # Set formatted text and cursor position
-        self.input_field.setText(formatted)
-        self.input_field.setCursorPosition(min(new_pos, len(formatted)))
+        if formatted == text and new_pos == cursor_pos:
+            # Already formatted: setText would still reset the undo history and
+            # cursor and schedule a repaint, so leave the line edit untouched
+            return
 
-        # Reconnect signal
-        self.input_field.textChanged.connect(self.format_timecode_input)
+        # Set formatted text and cursor position without restarting the debounce timer
+        with QSignalBlocker(self.input_field):
+            self.input_field.setText(formatted)
+            self.input_field.setCursorPosition(min(new_pos, len(formatted)))
 
     def convert_timecode(self):
         """Convert input timecode to all formats"""
+        self.flush_pending_format()
         try:
             # Get input value
-            input_text = self.input_field.text().strip()
+            input_text = self.input_text()
 
             if not input_text:
                 self.show_error("Please enter a timecode value")
                 return
 
-            # Parse timecode with current format
-            tc = DfttTimecode(input_text, timecode_type=self.current_format, fps=self.current_fps,
-                            drop_frame=self.drop_frame, strict=self.strict_mode)
-
-            # Convert to all formats (in display order)
-            self.result_displays['frame'].setText(tc.timecode_output('frame'))
-            self.result_displays['time'].setText(tc.timecode_output('time'))
-            self.result_displays['smpte'].setText(tc.timecode_output('smpte'))
-            self.result_displays['srt'].setText(tc.timecode_output('srt'))
-            self.result_displays['dlp'].setText(tc.timecode_output('dlp'))
-            self.result_displays['ffmpeg'].setText(tc.timecode_output('ffmpeg'))
-            self.result_displays['fcpx'].setText(tc.timecode_output('fcpx'))
+            convert_key = (input_text, self.current_format, self.current_fps,
+                           self.drop_frame, self.strict_mode)
+            if convert_key != self._last_convert_key:
+                # Parse with the current format and convert to all formats (in display order)
+                outputs = _timecode_outputs(*convert_key)
+                # Repaint the results once after all seven fields are set
+                self.results_container.setUpdatesEnabled(False)
+                try:
+                    for display, output in zip(self.result_displays, outputs):
+                        if display.text() != output:
+                            display.setText(output)
+                finally:
+                    self.results_container.setUpdatesEnabled(True)
+                self._last_convert_key = convert_key
 
             self.status_label.setText("")
 
@@ -793,7 +916,8 @@ class TimecodeConverterWidget(QWidget):
 
     def clear_results(self):
         """Clear all result displays"""
-        for display in self.result_displays.values():
+        self._last_convert_key = None
+        for display in self.result_displays:
             display.clear()
 
     def clear_all(self):
@@ -804,13 +928,6 @@ class TimecodeConverterWidget(QWidget):
 
     def show_error(self, message):
         """Show error message"""
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: rgb(200, 100, 100);
-                font-size: 11px;
-                font-style: italic;
-            }
-        """)
         self.status_label.setText(message)
 
 
@@ -832,121 +949,12 @@ class TimecodeCalculatorWidget(QWidget):
         self.drop_frame = False
         self.options_expanded = False
 
-        # Get shared styles from parent
-        if isinstance(parent, QTabWidget) and hasattr(parent.parent(), 'common_styles'):
-            self.common_styles = parent.parent().common_styles
-        else:
-            self._init_styles()
+        # Inputs and settings of the last calculation, and its (result, history entry)
+        self._last_calc_key = None
+        self._last_calc_result = None
 
         self.setup_ui()
 
-    def _init_styles(self):
-        """Initialize common UI styles (fallback if no parent)"""
-        self.common_styles = {
-            'label_style': "color: rgb(145, 145, 145); font-size: 14px; font-weight: semibold; font-family: 'Open Sans', sans-serif;",
-            'button_style': """
-                QPushButton {
-                    background-color: rgb(40, 40, 46);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 12px;
-                    font-size: 11px;
-                    font-weight: semibold;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QPushButton:hover {
-                    background-color: rgb(53, 53, 58);
-                }
-                QPushButton:pressed {
-                    background-color: rgb(23, 23, 28);
-                }
-            """,
-            'input_style': """
-                QLineEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(200, 200, 200);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 5px 8px;
-                    font-size: 14px;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-                QLineEdit:focus {
-                    border: 1px solid rgb(100, 200, 255);
-                }
-            """,
-            'result_style': """
-                QLineEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(100, 200, 100);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 8px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-            """,
-            'combobox_style': """
-                QComboBox {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 3px 8px;
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    background: transparent;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border: none;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    selection-background-color: rgb(100, 200, 255);
-                }
-            """,
-            'textedit_style': """
-                QTextEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 5px;
-                    font-size: 11px;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-            """,
-            'checkbox_style': """
-                QCheckBox {
-                    color: rgb(145, 145, 145);
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                    spacing: 8px;
-                }
-                QCheckBox::indicator {
-                    width: 16px;
-                    height: 16px;
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 3px;
-                    background-color: rgb(31, 31, 31);
-                }
-                QCheckBox::indicator:hover {
-                    border: 1px solid rgb(100, 200, 255);
-                }
-                QCheckBox::indicator:checked {
-                    background-color: rgb(100, 200, 255);
-                    border: 1px solid rgb(100, 200, 255);
-                }
-            """
-        }
-
     def setup_ui(self):
         """Setup UI interface"""
         main_layout = QVBoxLayout(self)
@@ -958,7 +966,6 @@ class TimecodeCalculatorWidget(QWidget):
 
         # Advanced options (expandable)
         self.setup_advanced_options(main_layout)
-        self.update_strict_mode_availability()
         self.update_drop_frame_availability()
 
         self.add_separator(main_layout)
@@ -996,15 +1003,13 @@ class TimecodeCalculatorWidget(QWidget):
         label_layout.setSpacing(10)
 
         fps_label = QLabel("Frame Rate")
-        fps_label.setStyleSheet(self.common_styles['label_style'])
-        fps_label.setFixedHeight(15)
+        fps_label.setObjectName("FieldLabel")
         label_layout.addWidget(fps_label)
 
         label_layout.addStretch()
 
         format_label = QLabel("Timecode Format")
-        format_label.setStyleSheet(self.common_styles['label_style'])
-        format_label.setFixedHeight(15)
+        format_label.setObjectName("FieldLabel")
         label_layout.addWidget(format_label)
 
         label_widget = QWidget()
@@ -1018,18 +1023,16 @@ class TimecodeCalculatorWidget(QWidget):
 
         self.fps_combo = QComboBox()
         self.fps_combo.setFixedSize(120, 25)
-        self.fps_combo.addItems(["23.976", "23.98", "24", "25", "29.97", "30", "48", "50", "59.94", "60", "Custom"])
+        self.fps_combo.addItems(FPS_CHOICES)
         self.fps_combo.setCurrentText("25")
-        self.fps_combo.setStyleSheet(self.common_styles['combobox_style'])
         self.fps_combo.currentTextChanged.connect(self.on_fps_changed)
-        self._add_combobox_arrow(self.fps_combo)
         combo_layout.addWidget(self.fps_combo)
 
         # Custom FPS input (initially hidden)
         self.custom_fps_input = QLineEdit()
         self.custom_fps_input.setFixedSize(120, 25)
         self.custom_fps_input.setPlaceholderText("Enter FPS")
-        self.custom_fps_input.setStyleSheet(self.common_styles['input_style'])
+        self.custom_fps_input.setObjectName("FpsInput")
         self.custom_fps_input.setVisible(False)
         self.custom_fps_input.textChanged.connect(self.on_custom_fps_changed)
         self.custom_fps_input.returnPressed.connect(self.apply_custom_fps)
@@ -1039,19 +1042,9 @@ class TimecodeCalculatorWidget(QWidget):
 
         self.format_combo = QComboBox()
         self.format_combo.setFixedSize(150, 25)
-        self.format_combo.addItems([
-            "SMPTE (HH:MM:SS:FF)",
-            "SRT (HH:MM:SS,mmm)",
-            "DLP (HH:MM:SS:sss)",
-            "FFmpeg (HH:MM:SS.xx)",
-            "FCPX (fraction/s)",
-            "Frame (count)",
-            "Time (seconds)"
-        ])
+        self.format_combo.addItems(FORMAT_CHOICES)
         self.format_combo.setCurrentIndex(0)
-        self.format_combo.setStyleSheet(self.common_styles['combobox_style'])
         self.format_combo.currentIndexChanged.connect(self.on_format_changed)
-        self._add_combobox_arrow(self.format_combo, arrow_x=120)
         combo_layout.addWidget(self.format_combo)
 
         combo_widget = QWidget()
@@ -1071,75 +1064,63 @@ class TimecodeCalculatorWidget(QWidget):
         toggle_layout.setContentsMargins(0, 0, 0, 0)
 
         self.toggle_btn = QPushButton("▶ Advanced Options")
-        self.toggle_btn.setFixedHeight(20)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: rgb(145, 145, 145);
-                border: none;
-                text-align: left;
-                padding-left: 0px;
-                font-size: 11px;
-                font-family: 'Open Sans', sans-serif;
-            }
-            QPushButton:hover {
-                color: rgb(100, 200, 255);
-            }
-        """)
+        self.toggle_btn.setObjectName("ToggleButton")
         self.toggle_btn.clicked.connect(self.toggle_advanced_options)
         toggle_layout.addWidget(self.toggle_btn)
         toggle_layout.addStretch()
 
         options_layout.addLayout(toggle_layout)
 
-        # Collapsible content
+        # The checkboxes are only built on first expand (see ensure_options),
+        # until then the settings live in strict_mode/drop_frame alone
+        self.options_content = None
+        self.options_container = options_container
+
+        layout.addWidget(options_container)
+
+    def ensure_options(self):
+        """Build the collapsible option checkboxes on first expand"""
+        if self.options_content is not None:
+            return
+
         self.options_content = QWidget()
-        self.options_content.setObjectName("options_content")
-        self.options_content.setStyleSheet("""
-            QWidget#options_content {
-                background-color: rgb(35, 35, 40);
-                border-radius: 3px;
-            }
-        """)
+        self.options_content.setObjectName("OptionsContent")
         content_layout = QHBoxLayout(self.options_content)
         content_layout.setContentsMargins(10, 8, 10, 8)
         content_layout.setSpacing(15)
 
         # Strict Mode checkbox
         self.strict_mode_cb = QCheckBox("Strict Mode")
-        self.strict_mode_cb.setChecked(True)
-        self.strict_mode_cb.setStyleSheet(self.common_styles['checkbox_style'])
-        self.strict_mode_cb.stateChanged.connect(self.on_strict_mode_changed)
         content_layout.addWidget(self.strict_mode_cb)
 
         # Drop Frame checkbox
         self.drop_frame_cb = QCheckBox("Drop Frame")
-        self.drop_frame_cb.setStyleSheet(self.common_styles['checkbox_style'])
-        self.drop_frame_cb.stateChanged.connect(self.on_drop_frame_changed)
         content_layout.addWidget(self.drop_frame_cb)
 
         content_layout.addStretch()
 
-        options_layout.addWidget(self.options_content)
-
-        # Initially hide the options
-        self.options_content.setMaximumHeight(0)
-        self.options_content.setVisible(False)
+        self.options_container.layout().addWidget(self.options_content)
 
-        layout.addWidget(options_container)
+        # Pick up the current settings before listening for user changes
+        self.update_option_checkboxes()
+        self.strict_mode_cb.stateChanged.connect(self.on_strict_mode_changed)
+        self.drop_frame_cb.stateChanged.connect(self.on_drop_frame_changed)
 
     def toggle_advanced_options(self):
         """Toggle advanced options visibility"""
         self.options_expanded = not self.options_expanded
 
-        if self.options_expanded:
-            self.toggle_btn.setText("▼ Advanced Options")
-            self.options_content.setMaximumHeight(16777215)
-            self.options_content.setVisible(True)
-        else:
-            self.toggle_btn.setText("▶ Advanced Options")
-            self.options_content.setVisible(False)
-            self.options_content.setMaximumHeight(0)
+        # Repaint once after the button and the section have both changed
+        self.setUpdatesEnabled(False)
+        try:
+            if self.options_expanded:
+                self.ensure_options()
+                self.toggle_btn.setText("▼ Advanced Options")
+            else:
+                self.toggle_btn.setText("▶ Advanced Options")
+            self.options_content.setVisible(self.options_expanded)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def on_strict_mode_changed(self, state):
         """Handle strict mode checkbox change"""
@@ -1149,46 +1130,46 @@ class TimecodeCalculatorWidget(QWidget):
         """Handle drop frame checkbox change"""
         self.drop_frame = (state == Qt.Checked)
 
-    def update_strict_mode_availability(self):
-        """Strict mode is always available for user control"""
-        # Strict mode is always enabled for user control, no forced behavior
-        self.strict_mode_cb.setEnabled(True)
-
     def update_drop_frame_availability(self):
         """Enable/disable drop frame based on fps (force enable for 23.98)"""
-        fps = self.current_fps
-        is_drop_framable = (round(fps, 2) % 29.97 == 0 or round(fps, 2) % 23.98 == 0)
-
-        # Check if fps is 23.98
-        is_23_98 = (abs(fps - 23.98) < 0.01)
+        is_drop_framable, is_23_98 = drop_frame_support(self.current_fps)
 
         if is_23_98:
-            # Force enable drop frame for 23.98 and disable checkbox
-            self.drop_frame_cb.setChecked(True)
-            self.drop_frame_cb.setEnabled(False)
+            # Force enable drop frame for 23.98
             self.drop_frame = True
-        elif is_drop_framable:
-            # Enable checkbox for user control
-            self.drop_frame_cb.setEnabled(True)
-        else:
+        elif not is_drop_framable:
             # Disable drop frame for non-drop-framable rates
-            self.drop_frame_cb.setEnabled(False)
-            if self.drop_frame:
-                self.drop_frame_cb.setChecked(False)
-                self.drop_frame = False
+            self.drop_frame = False
+        self.update_option_checkboxes()
+
+    def update_option_checkboxes(self):
+        """Mirror strict/drop frame settings onto the checkboxes, if built"""
+        if self.options_content is None:
+            return
+
+        is_drop_framable, is_23_98 = drop_frame_support(self.current_fps)
+        # Strict mode is always enabled for user control, no forced behavior
+        self.strict_mode_cb.setChecked(self.strict_mode)
+        self.drop_frame_cb.setChecked(self.drop_frame)
+        # Only user-controllable for drop-framable rates other than 23.98
+        self.drop_frame_cb.setEnabled(is_drop_framable and not is_23_98)
 
     def setup_input_a(self, layout):
         """Setup timecode input A"""
         label_a = QLabel("Timecode A")
-        label_a.setStyleSheet(self.common_styles['label_style'])
-        label_a.setFixedHeight(15)
+        label_a.setObjectName("FieldLabel")
         layout.addWidget(label_a)
 
         self.input_a = QLineEdit()
         self.input_a.setPlaceholderText("00:00:00:00")
-        self.input_a.setStyleSheet(self.common_styles['input_style'])
-        self.input_a.setFixedHeight(35)
-        self.input_a.textChanged.connect(lambda: self.format_timecode_input(self.input_a))
+        self.input_a.setObjectName("InputField")
+        self._fmt_timer_a = QTimer(self)
+        self._fmt_timer_a.setSingleShot(True)
+        self._fmt_timer_a.setInterval(FORMAT_DEBOUNCE_MS)
+        self._fmt_timer_a.timeout.connect(partial(self.format_timecode_input, self.input_a))
+        # Each keystroke only restarts the debounce timer (free-form formats only)
+        self.input_a.textChanged.connect(self._fmt_timer_a.start)
+        self.apply_input_mask(self.input_a)
         self.input_a.returnPressed.connect(self.calculate)
         layout.addWidget(self.input_a)
 
@@ -1201,17 +1182,25 @@ class TimecodeCalculatorWidget(QWidget):
         self.add_btn = QPushButton("+")
         self.add_btn.setSizePolicy(self.add_btn.sizePolicy().Expanding, self.add_btn.sizePolicy().Fixed)
         self.add_btn.setFixedHeight(25)
-        self.add_btn.setStyleSheet(self.get_operation_button_style(True))
+        self.add_btn.setObjectName("OperationButton")
+        self.add_btn.setCheckable(True)
+        self.add_btn.setChecked(True)
         self.add_btn.clicked.connect(lambda: self.set_operation('+'))
         op_layout.addWidget(self.add_btn)
 
         self.subtract_btn = QPushButton("−")
         self.subtract_btn.setSizePolicy(self.subtract_btn.sizePolicy().Expanding, self.subtract_btn.sizePolicy().Fixed)
         self.subtract_btn.setFixedHeight(25)
-        self.subtract_btn.setStyleSheet(self.get_operation_button_style(False))
+        self.subtract_btn.setObjectName("OperationButton")
+        self.subtract_btn.setCheckable(True)
         self.subtract_btn.clicked.connect(lambda: self.set_operation('-'))
         op_layout.addWidget(self.subtract_btn)
 
+        # Exclusive group: the selected operation is shown by the :checked style
+        self.operation_group = QButtonGroup(self)
+        self.operation_group.addButton(self.add_btn)
+        self.operation_group.addButton(self.subtract_btn)
+
         # Create container widget for buttons
         button_widget = QWidget()
         button_widget.setLayout(op_layout)
@@ -1221,15 +1210,19 @@ class TimecodeCalculatorWidget(QWidget):
     def setup_input_b(self, layout):
         """Setup timecode input B"""
         label_b = QLabel("Timecode B")
-        label_b.setStyleSheet(self.common_styles['label_style'])
-        label_b.setFixedHeight(15)
+        label_b.setObjectName("FieldLabel")
         layout.addWidget(label_b)
 
         self.input_b = QLineEdit()
         self.input_b.setPlaceholderText("00:00:00:00")
-        self.input_b.setStyleSheet(self.common_styles['input_style'])
-        self.input_b.setFixedHeight(35)
-        self.input_b.textChanged.connect(lambda: self.format_timecode_input(self.input_b))
+        self.input_b.setObjectName("InputField")
+        self._fmt_timer_b = QTimer(self)
+        self._fmt_timer_b.setSingleShot(True)
+        self._fmt_timer_b.setInterval(FORMAT_DEBOUNCE_MS)
+        self._fmt_timer_b.timeout.connect(partial(self.format_timecode_input, self.input_b))
+        # Each keystroke only restarts the debounce timer (free-form formats only)
+        self.input_b.textChanged.connect(self._fmt_timer_b.start)
+        self.apply_input_mask(self.input_b)
         self.input_b.returnPressed.connect(self.calculate)
         layout.addWidget(self.input_b)
 
@@ -1237,90 +1230,62 @@ class TimecodeCalculatorWidget(QWidget):
         """Setup calculate button"""
         self.calc_btn = QPushButton("Calculate")
         self.calc_btn.setFixedHeight(25)
-        self.calc_btn.setStyleSheet(self.common_styles['button_style'])
         self.calc_btn.clicked.connect(self.calculate)
         layout.addWidget(self.calc_btn)
 
     def setup_result(self, layout):
         """Setup result display"""
         result_label = QLabel("Result")
-        result_label.setStyleSheet(self.common_styles['label_style'])
-        result_label.setFixedHeight(15)
+        result_label.setObjectName("FieldLabel")
         layout.addWidget(result_label)
 
         self.result_display = QLineEdit()
         self.result_display.setReadOnly(True)
         self.result_display.setPlaceholderText("00:00:00:00")
-        self.result_display.setStyleSheet(self.common_styles['result_style'])
-        self.result_display.setFixedHeight(40)
+        self.result_display.setObjectName("ResultField")
         self.result_display.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.result_display)
 
         # Status label for errors
         self.status_label = QLabel("")
-        self.status_label.setFixedHeight(20)
+        self.status_label.setObjectName("StatusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: rgb(200, 100, 100);
-                font-size: 11px;
-                font-style: italic;
-            }
-        """)
         layout.addWidget(self.status_label)
 
     def setup_history(self, layout):
         """Setup calculation history"""
         history_label = QLabel("History")
-        history_label.setStyleSheet(self.common_styles['label_style'])
-        history_label.setFixedHeight(15)
+        history_label.setObjectName("FieldLabel")
         layout.addWidget(history_label)
 
-        self.history_display = QTextEdit()
-        self.history_display.setReadOnly(True)
-        self.history_display.setFixedHeight(120)
-        self.history_display.setStyleSheet(self.common_styles['textedit_style'])
-        layout.addWidget(self.history_display)
+        # The list and its clear button are only built by the first
+        # calculation (see ensure_history), most sessions never need them
+        self.history_display = None
+        self.history_container = QWidget()
+        history_layout = QVBoxLayout(self.history_container)
+        history_layout.setContentsMargins(0, 0, 0, 0)
+        history_layout.setSpacing(layout.spacing())
+        layout.addWidget(self.history_container)
+
+    def ensure_history(self):
+        """Build the history list and clear button on first use"""
+        if self.history_display is not None:
+            return
+
+        # One item per calculation, newest first
+        self.history_display = QListWidget()
+        self.history_display.setObjectName("HistoryDisplay")
+        self.history_display.setWordWrap(True)
+        self.history_display.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.history_display.setSelectionMode(QAbstractItemView.NoSelection)
+        self.history_display.setFocusPolicy(Qt.NoFocus)
+        self.history_container.layout().addWidget(self.history_display)
 
         # Clear history button
         clear_history_btn = QPushButton("Clear History")
         clear_history_btn.setFixedHeight(25)
-        clear_history_btn.setStyleSheet(self.common_styles['button_style'])
         clear_history_btn.clicked.connect(self.clear_history)
-        layout.addWidget(clear_history_btn)
-
-    def get_operation_button_style(self, is_selected):
-        """Get style for operation button"""
-        if is_selected:
-            return """
-                QPushButton {
-                    background-color: rgb(100, 200, 255);
-                    color: rgb(255, 255, 255);
-                    border: 2px solid rgb(255, 255, 255);
-                    border-radius: 12px;
-                    font-size: 11px;
-                    font-weight: semibold;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QPushButton:hover {
-                    background-color: rgb(120, 210, 255);
-                }
-            """
-        else:
-            return """
-                QPushButton {
-                    background-color: rgb(40, 40, 46);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 12px;
-                    font-size: 11px;
-                    font-weight: semibold;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QPushButton:hover {
-                    background-color: rgb(53, 53, 58);
-                }
-            """
+        self.history_container.layout().addWidget(clear_history_btn)
 
     def add_separator(self, layout):
         """Add a separator line"""
@@ -1328,25 +1293,9 @@ class TimecodeCalculatorWidget(QWidget):
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Plain)
         separator.setLineWidth(1)
-        separator.setStyleSheet("background-color: rgb(9, 9, 9); border: none;")
-        separator.setFixedHeight(1)
+        separator.setObjectName("Separator")
         layout.addWidget(separator)
 
-    def _add_combobox_arrow(self, combobox, arrow_x=90):
-        """Add custom arrow to combobox"""
-        arrow_label = QLabel("⌄", combobox)
-        arrow_label.setStyleSheet("""
-            QLabel {
-                color: rgb(145, 145, 145);
-                background: transparent;
-                font-size: 10px;
-                border: none;
-            }
-        """)
-        arrow_label.setAlignment(Qt.AlignCenter)
-        arrow_label.setGeometry(arrow_x, 4, 15, 12)
-        arrow_label.setAttribute(Qt.WA_TransparentForMouseEvents)
-
     # Event handlers
     def on_fps_changed(self, text):
         """Handle FPS change"""
@@ -1360,28 +1309,20 @@ class TimecodeCalculatorWidget(QWidget):
             self.custom_fps_input.setVisible(False)
             try:
                 self.current_fps = float(text)
-                self.update_strict_mode_availability()
                 self.update_drop_frame_availability()
             except ValueError:
                 self.current_fps = 25
+            self.update_input_masks()
 
     def on_custom_fps_changed(self, text):
         """Handle custom FPS input change"""
         # Only allow digits and decimal point
-        allowed = ''
-        has_dot = False
-        for c in text:
-            if c.isdigit():
-                allowed += c
-            elif c == '.' and not has_dot:
-                allowed += c
-                has_dot = True
+        allowed = clean_decimal_input(text)
 
         if allowed != text:
-            # Temporarily disconnect to avoid recursive calls
-            self.custom_fps_input.textChanged.disconnect()
-            self.custom_fps_input.setText(allowed)
-            self.custom_fps_input.textChanged.connect(self.on_custom_fps_changed)
+            # Block signals to avoid recursive calls
+            with QSignalBlocker(self.custom_fps_input):
+                self.custom_fps_input.setText(allowed)
             return
 
         # Auto-apply custom FPS if valid
@@ -1390,8 +1331,8 @@ class TimecodeCalculatorWidget(QWidget):
                 fps = float(allowed)
                 if fps > 0 and fps <= 1000:  # Reasonable FPS range
                     self.current_fps = fps
-                    self.update_strict_mode_availability()
                     self.update_drop_frame_availability()
+                    self.update_input_masks()
                     self.status_label.clear()
             except ValueError:
                 pass  # Ignore incomplete input like "12."
@@ -1404,8 +1345,8 @@ class TimecodeCalculatorWidget(QWidget):
                 fps = float(text)
                 if fps > 0 and fps <= 1000:  # Reasonable FPS range
                     self.current_fps = fps
-                    self.update_strict_mode_availability()
                     self.update_drop_frame_availability()
+                    self.update_input_masks()
                     self.status_label.clear()
                 else:
                     self.show_error("FPS must be between 0 and 1000")
@@ -1414,62 +1355,54 @@ class TimecodeCalculatorWidget(QWidget):
 
     def on_format_changed(self, index):
         """Handle format change"""
-        format_map = {
-            0: 'smpte',
-            1: 'srt',
-            2: 'dlp',
-            3: 'ffmpeg',
-            4: 'fcpx',
-            5: 'frame',
-            6: 'time'
-        }
-        old_format = self.current_format
-        self.current_format = format_map.get(index, 'smpte')
+        new_format = format_type_at(index)
+        if new_format == self.current_format:
+            # Re-selected the same format, nothing to convert
+            return
 
-        # Update placeholder text based on format
-        placeholder_map = {
-            'smpte': '00:00:00:00',
-            'srt': '00:00:00,000',
-            'dlp': '00:00:00:000',
-            'ffmpeg': '00:00:00.00',
-            'fcpx': '0/1s',
-            'frame': '0',
-            'time': '0.0'
-        }
-        placeholder = placeholder_map.get(self.current_format, '00:00:00:00')
-        self.input_a.setPlaceholderText(placeholder)
-        self.input_b.setPlaceholderText(placeholder)
-        self.result_display.setPlaceholderText(placeholder)
-
-        # Convert existing timecodes to new format instead of clearing
-        self.convert_input_format(self.input_a, old_format)
-        self.convert_input_format(self.input_b, old_format)
-        self.convert_result_format(old_format)
+        # Finish formatting text typed in the old format before converting it
+        self.flush_pending_format()
 
-        self.status_label.clear()
+        old_format = self.current_format
+        self.current_format = new_format
 
-    def convert_input_format(self, line_edit, old_format):
-        """Convert timecode in input field from old format to current format"""
-        text = line_edit.text().strip()
-        if not text:
-            return
+        # Update placeholder text based on format
+        placeholder = FORMAT_PLACEHOLDERS[self.current_format]
 
+        # Repaint once after all fields have switched
+        self.setUpdatesEnabled(False)
         try:
-            # Parse timecode with old format
-            tc = DfttTimecode(text, timecode_type=old_format, fps=self.current_fps,
-                            drop_frame=self.drop_frame, strict=self.strict_mode)
+            if placeholder != self.input_a.placeholderText():
+                for line_edit in (self.input_a, self.input_b, self.result_display):
+                    line_edit.setPlaceholderText(placeholder)
 
-            # Convert to new format
-            new_text = tc.timecode_output(self.current_format)
+            # Convert existing timecodes to new format instead of clearing
+            self.convert_input_format(self.input_a, old_format)
+            self.convert_input_format(self.input_b, old_format)
+            self.convert_result_format(old_format)
 
-            # Temporarily disconnect signal to avoid triggering formatting
-            line_edit.textChanged.disconnect()
-            line_edit.setText(new_text)
-            line_edit.textChanged.connect(lambda: self.format_timecode_input(line_edit))
+            self.status_label.clear()
+        finally:
+            self.setUpdatesEnabled(True)
 
-        except Exception:
-            # If conversion fails, keep original text
-            pass
+    def convert_input_format(self, line_edit, old_format):
+        """Convert timecode in input field from old format to current format"""
+        text = self.input_text(line_edit)
+        new_text = text
+        if text:
+            try:
+                # Parse with the old format and output in the new one
+                new_text = _convert_timecode(text, old_format, self.current_format, self.current_fps,
+                                             self.drop_frame, self.strict_mode)
+            except Exception:
+                # If conversion fails, keep original text
+                pass
+
+        # Switch the input mask even when the field is empty; block signals to
+        # avoid triggering formatting
+        with QSignalBlocker(line_edit):
+            self.apply_input_mask(line_edit, new_text)
+            line_edit.setText(new_text)
 
     def convert_result_format(self, old_format):
         """Convert result display from old format to current format"""
@@ -1478,22 +1411,75 @@ class TimecodeCalculatorWidget(QWidget):
             return
 
         try:
-            # Parse timecode with old format
-            tc = DfttTimecode(text, timecode_type=old_format, fps=self.current_fps,
-                            drop_frame=self.drop_frame, strict=self.strict_mode)
-
-            # Convert to new format
-            new_text = tc.timecode_output(self.current_format)
+            # Parse with the old format and output in the new one
+            new_text = _convert_timecode(text, old_format, self.current_format, self.current_fps,
+                                         self.drop_frame, self.strict_mode)
             self.result_display.setText(new_text)
 
         except Exception:
             # If conversion fails, clear result
             self.result_display.clear()
 
+    def input_text(self, line_edit):
+        """Entered text of an input field, '' when it holds no digits"""
+        text = line_edit.text().strip()
+        if not text.translate(DIGITS_ONLY):
+            # Nothing to parse, e.g. an empty masked field (':::') or a lone '-'
+            return ''
+        return text
+
+    def apply_input_mask(self, line_edit, text=None):
+        """Set the input mask of the current format (none for free-form formats)
+
+        The field stays unmasked while its text (default: the current text)
+        does not fit the mask. Masked fields are formatted by Qt itself, so
+        the auto-format timer is only connected to textChanged while the
+        field has no mask.
+        """
+        mask = timecode_input_mask(self.current_format, self.current_fps)
+        old_mask = line_edit.inputMask()
+        if old_mask == mask:
+            return
+        if text is None:
+            text = self.input_text(line_edit)
+        if not fits_input_mask(text, mask):
+            # e.g. a negative time or 100+ hours converted to SMPTE
+            mask = ''
+            if not old_mask:
+                return
+        line_edit.setInputMask(mask)
+
+        timer = self._fmt_timer_a if line_edit is self.input_a else self._fmt_timer_b
+        if not mask:
+            line_edit.textChanged.connect(timer.start)
+        elif not old_mask:
+            timer.stop()
+            line_edit.textChanged.disconnect(timer.start)
+
+    def update_input_masks(self):
+        """Re-apply the input masks after an FPS change (SMPTE frame digits)"""
+        for line_edit in (self.input_a, self.input_b):
+            with QSignalBlocker(line_edit):
+                self.apply_input_mask(line_edit)
+
+    def flush_pending_format(self):
+        """Run any pending auto-format immediately (e.g. before calculating)"""
+        for timer, line_edit in ((self._fmt_timer_a, self.input_a), (self._fmt_timer_b, self.input_b)):
+            if timer.isActive():
+                timer.stop()
+                self.format_timecode_input(line_edit)
+
     def format_timecode_input(self, line_edit):
         """Auto-format timecode input based on selected format"""
-        # Temporarily disconnect to avoid recursive calls
-        line_edit.textChanged.disconnect()
+        if line_edit.inputMask():
+            # Fixed-layout formats are formatted by the input mask as typed
+            return
+        if timecode_input_mask(self.current_format, self.current_fps):
+            # Fixed-layout text that did not fit the mask; mask the field again
+            # once it is cleared or edited to fit
+            with QSignalBlocker(line_edit):
+                self.apply_input_mask(line_edit)
+            return
 
         # Get current text and cursor position
         text = line_edit.text()
@@ -1502,182 +1488,91 @@ class TimecodeCalculatorWidget(QWidget):
         formatted = text
         new_pos = cursor_pos
 
-        if self.current_format == 'smpte':
-            # SMPTE: HH:MM:SS:FF (FF can be 2-4 digits based on FPS)
-            # Determine max frame digits based on FPS
-            if self.current_fps >= 1000:
-                max_frame_digits = 4
-                max_total_digits = 10
-            elif self.current_fps >= 100:
-                max_frame_digits = 3
-                max_total_digits = 9
-            else:
-                max_frame_digits = 2
-                max_total_digits = 8
-
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:max_total_digits]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i in [1, 3, 5] and i < len(digits_only) - 1:
-                    formatted += ':'
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'srt':
-            # SRT: HH:MM:SS,mmm
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:9]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i == 1 or i == 3:
-                    formatted += ':'
-                elif i == 5 and i < len(digits_only) - 1:
-                    formatted += ','
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'dlp':
-            # DLP: HH:MM:SS:sss
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:9]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i in [1, 3, 5] and i < len(digits_only) - 1:
-                    formatted += ':'
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'ffmpeg':
-            # FFmpeg: HH:MM:SS.xx
-            digits_only = ''.join(filter(str.isdigit, text))
-            digits_only = digits_only[:8]
-
-            formatted = ''
-            for i, digit in enumerate(digits_only):
-                formatted += digit
-                if i == 1 or i == 3:
-                    formatted += ':'
-                elif i == 5 and i < len(digits_only) - 1:
-                    formatted += '.'
-
-            digits_before = len(''.join(filter(str.isdigit, text[:cursor_pos])))
-            new_pos = digits_before
-            if digits_before > 2:
-                new_pos += 1
-            if digits_before > 4:
-                new_pos += 1
-            if digits_before > 6:
-                new_pos += 1
-
-        elif self.current_format == 'fcpx':
+        if self.current_format == 'fcpx':
             # FCPX: fraction/s format
-            allowed = ''.join(c for c in text if c.isdigit() or c in ['/', 's'])
-            formatted = allowed
+            formatted = text.translate(FCPX_CHARS_ONLY)
             new_pos = min(cursor_pos, len(formatted))
 
         elif self.current_format == 'frame':
             # Frame: digits only
-            digits_only = ''.join(filter(str.isdigit, text))
-            formatted = digits_only
+            formatted = text.translate(DIGITS_ONLY)
             new_pos = min(cursor_pos, len(formatted))
 
         elif self.current_format == 'time':
             # Time: decimal number
-            allowed = ''
-            has_dot = False
-            for i, c in enumerate(text):
-                if c.isdigit():
-                    allowed += c
-                elif c == '.' and not has_dot:
-                    allowed += c
-                    has_dot = True
-                elif c == '-' and i == 0:
-                    allowed += c
-            formatted = allowed
+            formatted = clean_time_input(text)
             new_pos = min(cursor_pos, len(formatted))
 
-        # Set formatted text and cursor position
-        line_edit.setText(formatted)
-        line_edit.setCursorPosition(min(new_pos, len(formatted)))
+        if formatted == text and new_pos == cursor_pos:
+            # Already formatted: setText would still reset the undo history and
+            # cursor and schedule a repaint, so leave the line edit untouched
+            return
 
-        # Reconnect signal
-        line_edit.textChanged.connect(lambda: self.format_timecode_input(line_edit))
+        # Set formatted text and cursor position without re-triggering formatting
+        with QSignalBlocker(line_edit):
+            line_edit.setText(formatted)
+            line_edit.setCursorPosition(min(new_pos, len(formatted)))
 
     def set_operation(self, op):
         """Set current operation"""
         self.current_operation = op
 
-        # Update button styles
-        if op == '+':
-            self.add_btn.setStyleSheet(self.get_operation_button_style(True))
-            self.subtract_btn.setStyleSheet(self.get_operation_button_style(False))
-        else:
-            self.add_btn.setStyleSheet(self.get_operation_button_style(False))
-            self.subtract_btn.setStyleSheet(self.get_operation_button_style(True))
+        # Check the matching button, the group unchecks the other one
+        button = self.add_btn if op == '+' else self.subtract_btn
+        button.setChecked(True)
 
     def calculate(self):
         """Perform timecode calculation"""
+        self.flush_pending_format()
         try:
             # Get input values
-            tc_a_str = self.input_a.text().strip()
-            tc_b_str = self.input_b.text().strip()
+            tc_a_str = self.input_text(self.input_a)
+            tc_b_str = self.input_text(self.input_b)
 
             if not tc_a_str or not tc_b_str:
                 self.show_error("Please enter both timecode values")
                 return
 
-            # Parse timecodes with current format
-            tc_a = DfttTimecode(tc_a_str, timecode_type=self.current_format, fps=self.current_fps,
-                              drop_frame=self.drop_frame, strict=self.strict_mode)
-            tc_b = DfttTimecode(tc_b_str, timecode_type=self.current_format, fps=self.current_fps,
-                              drop_frame=self.drop_frame, strict=self.strict_mode)
-
-            # Perform calculation
-            if self.current_operation == '+':
-                result = tc_a + tc_b
-                op_symbol = '+'
+            calc_key = (tc_a_str, tc_b_str, self.current_operation, self.current_format,
+                        self.current_fps, self.drop_frame, self.strict_mode)
+            if calc_key == self._last_calc_key:
+                # Same inputs and settings as the last calculation, reuse its result
+                result_str, history_entry = self._last_calc_result
             else:
-                result = tc_a - tc_b
-                op_symbol = '−'
-
-            # Display result in selected format
-            result_str = result.timecode_output(self.current_format)
-            self.result_display.setText(result_str)
+                # Parse timecodes with current format
+                tc_a = _parse_timecode(tc_a_str, self.current_format, self.current_fps,
+                                       self.drop_frame, self.strict_mode)
+                tc_b = _parse_timecode(tc_b_str, self.current_format, self.current_fps,
+                                       self.drop_frame, self.strict_mode)
+
+                # Perform calculation
+                if self.current_operation == '+':
+                    result = tc_a + tc_b
+                    op_symbol = '+'
+                else:
+                    result = tc_a - tc_b
+                    op_symbol = '−'
+
+                # Result in selected format
+                result_str = result.timecode_output(self.current_format)
+
+                # History entry
+                tc_a_str_formatted = _convert_timecode(tc_a_str, self.current_format, self.current_format,
+                                                       self.current_fps, self.drop_frame, self.strict_mode)
+                tc_b_str_formatted = _convert_timecode(tc_b_str, self.current_format, self.current_format,
+                                                       self.current_fps, self.drop_frame, self.strict_mode)
+                format_display = FORMAT_NAMES[self.current_format]
+                history_entry = f"{tc_a_str_formatted} {op_symbol} {tc_b_str_formatted} = {result_str} [{format_display} @ {self.current_fps}fps]"
+
+                self._last_calc_key = calc_key
+                self._last_calc_result = (result_str, history_entry)
+
+            # Display result (may have been converted to another format since)
+            if self.result_display.text() != result_str:
+                self.result_display.setText(result_str)
             self.status_label.setText("")
 
             # Add to history
-            tc_a_str_formatted = tc_a.timecode_output(self.current_format)
-            tc_b_str_formatted = tc_b.timecode_output(self.current_format)
-            format_display = self.format_combo.currentText().split(' ')[0]
-            history_entry = f"{tc_a_str_formatted} {op_symbol} {tc_b_str_formatted} = {result_str} [{format_display} @ {self.current_fps}fps]"
             self.add_to_history(history_entry)
 
         except Exception as e:
@@ -1685,32 +1580,20 @@ class TimecodeCalculatorWidget(QWidget):
 
     def add_to_history(self, entry):
         """Add entry to history"""
-        current_history = self.history_display.toPlainText()
-        if current_history:
-            new_history = entry + "\n" + current_history
-        else:
-            new_history = entry
+        self.ensure_history()
+        self.history_display.insertItem(0, entry)
 
-        # Keep only last 10 entries
-        lines = new_history.split('\n')
-        if len(lines) > 10:
-            lines = lines[:10]
-
-        self.history_display.setPlainText('\n'.join(lines))
+        # Keep only the last HISTORY_LIMIT entries
+        if self.history_display.count() > HISTORY_LIMIT:
+            self.history_display.takeItem(HISTORY_LIMIT)
 
     def clear_history(self):
         """Clear calculation history"""
-        self.history_display.clear()
+        if self.history_display is not None:
+            self.history_display.clear()
 
     def show_error(self, message):
         """Show error message"""
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: rgb(200, 100, 100);
-                font-size: 11px;
-                font-style: italic;
-            }
-        """)
         self.status_label.setText(message)
 
 
@@ -1724,127 +1607,15 @@ class TimecodeToolbox(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        # Define common UI styles
-        self._init_styles()
-
         # Setup UI
         self.setup_ui()
 
-    def _init_styles(self):
-        """Initialize common UI styles"""
-        self.common_styles = {
-            'font_family': "'Open Sans', sans-serif",
-            'label_style': "color: rgb(145, 145, 145); font-size: 14px; font-weight: semibold; font-family: 'Open Sans', sans-serif;",
-            'button_style': """
-                QPushButton {
-                    background-color: rgb(40, 40, 46);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 12px;
-                    font-size: 11px;
-                    font-weight: semibold;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QPushButton:hover {
-                    background-color: rgb(53, 53, 58);
-                }
-                QPushButton:pressed {
-                    background-color: rgb(23, 23, 28);
-                }
-            """,
-            'input_style': """
-                QLineEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(200, 200, 200);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 5px 8px;
-                    font-size: 14px;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-                QLineEdit:focus {
-                    border: 1px solid rgb(100, 200, 255);
-                }
-            """,
-            'result_style': """
-                QLineEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(100, 200, 100);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 8px;
-                    font-size: 18px;
-                    font-weight: bold;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-            """,
-            'combobox_style': """
-                QComboBox {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 3px 8px;
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    background: transparent;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border: none;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    selection-background-color: rgb(100, 200, 255);
-                }
-            """,
-            'textedit_style': """
-                QTextEdit {
-                    background-color: rgb(31, 31, 31);
-                    color: rgb(145, 145, 145);
-                    border: 1px solid rgb(7, 7, 7);
-                    border-radius: 3px;
-                    padding: 5px;
-                    font-size: 11px;
-                    font-family: 'Courier New', 'Monaco', monospace;
-                }
-            """,
-            'checkbox_style': """
-                QCheckBox {
-                    color: rgb(145, 145, 145);
-                    font-size: 12px;
-                    font-family: 'Open Sans', sans-serif;
-                    spacing: 8px;
-                }
-                QCheckBox::indicator {
-                    width: 16px;
-                    height: 16px;
-                    border: 1px solid rgb(100, 100, 100);
-                    border-radius: 3px;
-                    background-color: rgb(31, 31, 31);
-                }
-                QCheckBox::indicator:hover {
-                    border: 1px solid rgb(100, 200, 255);
-                }
-                QCheckBox::indicator:checked {
-                    background-color: rgb(100, 200, 255);
-                    border: 1px solid rgb(100, 200, 255);
-                }
-            """
-        }
-
     def setup_ui(self):
         """Setup UI interface"""
         # Main window settings
         self.setWindowTitle("🐘 Timecode Toolbox")
         self.setMinimumSize(400, 700)
         self.resize(400, 750)
-        self.setStyleSheet("background-color: rgb(40, 40, 46);")
 
         # Central widget
         central_widget = QWidget()
@@ -1859,57 +1630,46 @@ class TimecodeToolbox(QMainWindow):
         self.setup_header(main_layout)
         self.add_separator(main_layout)
 
-        # Tab widget
+        # Tab widget (added to the layout before the tabs are built, reparenting
+        # it afterwards loses the stylesheet font/colour of the combobox arrows)
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid rgb(9, 9, 9);
-                background-color: rgb(40, 40, 46);
-                border-radius: 3px;
-            }
-            QTabBar::tab {
-                background-color: rgb(31, 31, 31);
-                color: rgb(145, 145, 145);
-                border: 1px solid rgb(9, 9, 9);
-                border-bottom: none;
-                padding: 8px 16px;
-                margin-right: 2px;
-                font-family: 'Open Sans', sans-serif;
-                font-size: 12px;
-            }
-            QTabBar::tab:selected {
-                background-color: rgb(40, 40, 46);
-                color: rgb(255, 255, 255);
-                border-bottom: 2px solid rgb(100, 200, 255);
-            }
-            QTabBar::tab:hover {
-                background-color: rgb(53, 53, 58);
-            }
-        """)
+        main_layout.addWidget(self.tab_widget)
 
         # Add converter widget
         self.converter_widget = TimecodeConverterWidget(self.tab_widget)
         self.tab_widget.addTab(self.converter_widget, "Converter")
 
-        # Add calculator widget
-        self.calculator_widget = TimecodeCalculatorWidget(self.tab_widget)
-        self.tab_widget.addTab(self.calculator_widget, "Calculator")
+        # Add calculator page, its widget is only built when the tab is first
+        # shown (see ensure_calculator)
+        self.calculator_widget = None
+        self.calculator_page = QWidget()
+        calculator_layout = QVBoxLayout(self.calculator_page)
+        calculator_layout.setContentsMargins(0, 0, 0, 0)
+        self.tab_widget.addTab(self.calculator_page, "Calculator")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+
+    def on_tab_changed(self, index):
+        """Handle tab change"""
+        if self.tab_widget.widget(index) is self.calculator_page:
+            self.ensure_calculator()
+
+    def ensure_calculator(self):
+        """Build the calculator widget on first use"""
+        if self.calculator_widget is not None:
+            return
 
-        main_layout.addWidget(self.tab_widget)
+        self.calculator_widget = TimecodeCalculatorWidget(self.calculator_page)
+        self.calculator_page.layout().addWidget(self.calculator_widget)
 
     def setup_header(self, layout):
         """Setup header section"""
         title_label = QLabel("Timecode Toolbox")
-        title_label.setStyleSheet(
-            "color: rgb(255, 255, 255); font-size: 16px; font-weight: regular; font-family: 'Open Sans', sans-serif;"
-        )
+        title_label.setObjectName("TitleLabel")
         title_label.setAlignment(Qt.AlignLeft)
         layout.addWidget(title_label)
 
         desc_label = QLabel("Convert and calculate timecodes")
-        desc_label.setStyleSheet(
-            "color: rgb(145, 145, 145); font-size: 11px; font-style: italic; font-family: 'Open Sans', sans-serif;"
-        )
+        desc_label.setObjectName("DescLabel")
         desc_label.setAlignment(Qt.AlignLeft)
         layout.addWidget(desc_label)
 
@@ -1919,11 +1679,37 @@ class TimecodeToolbox(QMainWindow):
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Plain)
         separator.setLineWidth(1)
-        separator.setStyleSheet("background-color: rgb(9, 9, 9); border: none;")
-        separator.setFixedHeight(1)
+        separator.setObjectName("Separator")
         layout.addWidget(separator)
 
 
+# Dark palette as (role, rgb) pairs
+DARK_PALETTE_COLORS = (
+    (QPalette.Window, (40, 40, 46)),
+    (QPalette.WindowText, (255, 255, 255)),
+    (QPalette.Base, (31, 31, 31)),
+    (QPalette.AlternateBase, (40, 40, 46)),
+    (QPalette.ToolTipBase, (255, 255, 255)),
+    (QPalette.ToolTipText, (255, 255, 255)),
+    (QPalette.Text, (255, 255, 255)),
+    (QPalette.Button, (40, 40, 46)),
+    (QPalette.ButtonText, (255, 255, 255)),
+    (QPalette.BrightText, (255, 0, 0)),
+    (QPalette.Link, (100, 200, 255)),
+    (QPalette.Highlight, (100, 200, 255)),
+    (QPalette.HighlightedText, (0, 0, 0)),
+)
+
+
+@lru_cache(maxsize=None)
+def _build_dark_palette():
+    """Build the dark application palette (built once, then reused)"""
+    palette = QPalette()
+    for role, rgb in DARK_PALETTE_COLORS:
+        palette.setColor(role, QColor(*rgb))
+    return palette
+
+
 def main():
     """Main function"""
     import os
@@ -1935,28 +1721,20 @@ def main():
 
     # Set application style
     app.setStyle('Fusion')
+    ui_font = QFont(UI_FONT_FAMILY)
+    app.setFont(ui_font)
+    app.setStyleSheet(APP_QSS)
 
     # Set dark palette
-    palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(40, 40, 46))
-    palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Base, QColor(31, 31, 31))
-    palette.setColor(QPalette.AlternateBase, QColor(40, 40, 46))
-    palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Text, QColor(255, 255, 255))
-    palette.setColor(QPalette.Button, QColor(40, 40, 46))
-    palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-    palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
-    palette.setColor(QPalette.Link, QColor(100, 200, 255))
-    palette.setColor(QPalette.Highlight, QColor(100, 200, 255))
-    palette.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
-    app.setPalette(palette)
+    app.setPalette(_build_dark_palette())
 
     # Create and show main window
     window = TimecodeToolbox()
     window.show()
 
+    # Warm up timecode parsing once the event loop is running (after the first paint)
+    QTimer.singleShot(0, warm_up_timecode)
+
     sys.exit(app.exec_())
 
 
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts_ui'))
+
+from PyQt5.QtWidgets import QApplication
+
+import TC_Toolbox
+
+app = QApplication.instance() or QApplication(sys.argv[:1])
+
+SMPTE, FRAME, TIME = (TC_Toolbox.FORMAT_TYPES.index(t) for t in ('smpte', 'frame', 'time'))
+
+
+class CalculatorFormatSwitchTest(unittest.TestCase):
+    """Converted inputs that do not fit the fixed-layout mask stay intact"""
+
+    def setUp(self):
+        self.calc = TC_Toolbox.TimecodeCalculatorWidget()
+
+    def test_negative_time_keeps_sign_in_smpte(self):
+        self.calc.format_combo.setCurrentIndex(TIME)
+        self.calc.input_a.setText('-1.5')
+        self.calc.input_b.setText('2')
+        self.calc.format_combo.setCurrentIndex(SMPTE)
+
+        self.assertEqual(self.calc.input_a.text(), '-00:00:01:13')
+        self.assertEqual(self.calc.input_a.inputMask(), '')
+        self.calc.calculate()
+        self.assertEqual(self.calc.result_display.text(), '00:00:00:12')
+
+    def test_hundred_plus_hours_keep_all_digits_in_smpte(self):
+        self.calc.format_combo.setCurrentIndex(FRAME)
+        self.calc.input_a.setText('10000000')
+        self.calc.format_combo.setCurrentIndex(SMPTE)
+
+        self.assertEqual(self.calc.input_a.text(), '111:06:40:00')
+        self.assertEqual(self.calc.input_a.inputMask(), '')
+
+
+class ConverterAutoFormatTest(unittest.TestCase):
+    """Auto-format only rewrites the input when the text actually changes"""
+
+    def setUp(self):
+        self.converter = TC_Toolbox.TimecodeConverterWidget()
+        self.converter.format_combo.setCurrentIndex(FRAME)
+
+    def test_formatted_input_keeps_undo_history(self):
+        self.converter.input_field.insert('1234')
+        self.converter.format_timecode_input()
+
+        self.assertEqual(self.converter.input_field.text(), '1234')
+        self.assertTrue(self.converter.input_field.isUndoAvailable())
+
+    def test_invalid_characters_are_removed(self):
+        self.converter.input_field.insert('12a34')
+        self.converter.format_timecode_input()
+
+        self.assertEqual(self.converter.input_field.text(), '1234')
+
+
+if __name__ == '__main__':
+    unittest.main()